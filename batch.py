@@ -0,0 +1,213 @@
+import argparse
+import csv
+import json
+import sys
+
+import numpy as np
+
+from parallel import evaluate_parallel
+from solver import (
+    AUTO, INTERPOLANTS, MATH_FUNCTIONS, PROFILER, UNIFORM_METHODS, AutoInterpolant, Dataset, SeriesInterpolant,
+    SweepRow, check_method, convergence_sweep, fitted_interpolant, load_dataset, read_series,
+)
+
+
+def parse_point(text):
+    x, y = text.split(',')
+    return float(x), float(y)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Пакетная интерполяция без графического интерфейса")
+
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--file', help="CSV-файл с узлами x,y")
+    source.add_argument('--func', choices=sorted(MATH_FUNCTIONS), help="функция для построения узлов")
+    source.add_argument('--table', nargs='+', type=parse_point, metavar='X,Y', help="узлы в виде x,y")
+    parser.add_argument('--left', type=float, default=-3.14)
+    parser.add_argument('--right', type=float, default=3.14)
+    parser.add_argument('--n', type=int, default=5, help="число узлов для --func (с --tolerance — наибольшее)")
+    parser.add_argument('--tolerance', type=float, help="подобрать узлы для --func под заданную точность")
+    parser.add_argument('--series', action='store_true', help="файл содержит несколько столбцов y")
+    parser.add_argument(
+        '--sweep', nargs='+', type=int, metavar='N', help="серия расчётов по числу узлов с ошибкой (только с --func)"
+    )
+    parser.add_argument(
+        '--interval', nargs=2, type=float, action='append', metavar=('LEFT', 'RIGHT'),
+        help="отрезок для --sweep (можно повторять; по умолчанию --left/--right)",
+    )
+
+    queries = parser.add_mutually_exclusive_group(required=True)
+    queries.add_argument('--x', nargs='+', type=float, help="точки x*")
+    queries.add_argument('--x-file', help="файл с точками x* (первый столбец)")
+    queries.add_argument('--x-range', nargs=3, type=float, metavar=('START', 'STOP', 'COUNT'))
+
+    parser.add_argument(
+        '--methods', default='newton_divided',
+        help="методы через запятую: " + ", ".join(list(INTERPOLANTS) + [AUTO]) + " или all",
+    )
+    parser.add_argument('--window', type=int, default=0, help="размер локального окна (0 — все узлы)")
+    parser.add_argument('--workers', type=int, default=0, help="число процессов (0 — все ядра)")
+    parser.add_argument('--format', choices=['csv', 'json'], default='csv')
+    parser.add_argument('--output', help="файл результата (по умолчанию stdout)")
+    parser.add_argument('--profile', metavar='JSON', help="записать время по этапам в JSON")
+    parser.add_argument(
+        '--profile-memory', action='store_true', help="добавить в профиль пик памяти (замедляет Python-код)"
+    )
+    return parser
+
+
+def read_dataset(args):
+    if args.file:
+        return load_dataset('file', args.file)
+    if args.func:
+        if args.n < 2 or args.right <= args.left:
+            raise ValueError("Для режима «Функция» нужно N ≥ 2 и левая граница < правой")
+        source = {'name': args.func, 'left': args.left, 'right': args.right, 'n': args.n}
+        if args.tolerance is not None:
+            source['tolerance'] = args.tolerance
+            if any(method in UNIFORM_METHODS for method in parse_methods(args.methods)):
+                source['kinds'] = ('equispaced',)
+        return load_dataset('func', source)
+    return load_dataset('table', args.table)
+
+
+def read_queries(args):
+    if args.x is not None:
+        return np.array(args.x, dtype=float)
+    if args.x_file:
+        return np.loadtxt(args.x_file, delimiter=',', usecols=0, ndmin=1)
+    start, stop, count = args.x_range
+    return np.linspace(start, stop, int(count))
+
+
+def parse_methods(text):
+    if text == 'all':
+        return list(INTERPOLANTS)
+    methods = [name.strip() for name in text.split(',') if name.strip()]
+    for name in methods:
+        if name not in INTERPOLANTS and name != AUTO:
+            raise ValueError(f"Неизвестный метод: {name}")
+    return methods
+
+
+def run(data, xs, methods, window=None, workers=None):
+    results = {}
+    errors = {}
+    for method in methods:
+        try:
+            check_method(method, data, window)
+            with PROFILER.stage(method):
+                results[method] = evaluate_parallel(fitted_interpolant(data, method, window), xs, workers)
+        except Exception as e:
+            errors[method] = str(e)
+    return results, errors
+
+
+def run_series(x, Y, xs, methods):
+    results = {}
+    errors = {}
+    for method in methods:
+        try:
+            check_method(method, x)
+            with PROFILER.stage(method):
+                if method == AUTO:
+                    values = run_series_auto(x, Y, xs)
+                else:
+                    values = SeriesInterpolant.fit(x, Y, method).evaluate(xs)
+        except Exception as e:
+            errors[method] = str(e)
+            continue
+        for j in range(values.shape[1]):
+            results[f"{method}_y{j + 1}"] = values[:, j]
+    return results, errors
+
+
+def run_series_auto(x, Y, xs):
+    values = np.empty((len(xs), Y.shape[1]))
+    for method, index in AutoInterpolant(Dataset(x, Y[:, 0])).plan(xs).items():
+        values[index] = SeriesInterpolant.fit(x, Y, method).evaluate(xs[index])
+    return values
+
+
+def write_csv(out, xs, results):
+    header = ",".join(['x'] + list(results))
+    table = np.column_stack([xs] + list(results.values()))
+    np.savetxt(out, table, delimiter=',', fmt='%.17g', header=header, comments='')
+
+
+def write_json(out, xs, results, errors):
+    payload = {
+        'x': xs.tolist(),
+        'results': {method: values.tolist() for method, values in results.items()},
+        'errors': errors,
+    }
+    json.dump(payload, out, ensure_ascii=False)
+    out.write("\n")
+
+
+def write_sweep(out, rows, fmt):
+    if fmt == 'json':
+        json.dump([row._asdict() for row in rows], out, ensure_ascii=False)
+        out.write("\n")
+        return
+    writer = csv.writer(out)
+    writer.writerow(SweepRow._fields)
+    writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.series and (not args.file or args.window):
+        parser.error("--series работает только с --file и без --window")
+    if args.sweep and (not args.func or args.window):
+        parser.error("--sweep работает только с --func и без --window")
+    if args.profile:
+        PROFILER.enable(memory=args.profile_memory)
+    PROFILER.reset()
+    try:
+        with PROFILER.stage('load'):
+            if args.series:
+                x, Y = read_series(args.file)
+            elif not args.sweep:
+                data = read_dataset(args)
+        xs = read_queries(args)
+        methods = parse_methods(args.methods)
+    except Exception as e:
+        print(f"Ошибка подготовки данных: {e}", file=sys.stderr)
+        return 2
+
+    if args.sweep:
+        intervals = args.interval or [(args.left, args.right)]
+        with PROFILER.stage('sweep'):
+            rows = convergence_sweep(args.func, args.sweep, xs, methods, intervals)
+        write = lambda out: write_sweep(out, rows, args.format)
+        done = bool(rows)
+    else:
+        if args.series:
+            results, errors = run_series(x, Y, xs, methods)
+        else:
+            results, errors = run(data, xs, methods, args.window or None, args.workers or None)
+        for method, msg in errors.items():
+            print(f"{method}: {msg}", file=sys.stderr)
+        if args.format == 'json':
+            write = lambda out: write_json(out, xs, results, errors)
+        else:
+            write = lambda out: write_csv(out, xs, results)
+        done = bool(results)
+
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        with PROFILER.stage('write'):
+            write(out)
+    finally:
+        if args.output:
+            out.close()
+    if args.profile:
+        PROFILER.export_json(args.profile)
+    return 0 if done else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+from solver import (
+    FIT_CACHE, INTERPOLANTS, RESULT_METHODS, AutoInterpolant, Dataset, LocalInterpolant, SeriesInterpolant,
+    adaptive_samples, bessel_interpolation, build_diff_table, build_divided_diff, check_method,
+    execute_interpolation, iter_diff_levels, iter_results, lagrange_interpolation, load_dataset, newton_divided,
+    newton_finite, read_nodes, stirling_interpolation,
+)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, 'bench_baseline.json')
+NODE_COUNTS = (5, 50, 500, 2000, 10000)
+QUICK_NODE_COUNTS = (5, 50, 500)
+QUERY_SIZES = (1, 1000, 100000)
+GRIDS = ('uniform', 'chebyshev')
+FINITE_METHODS = ('newton_finite', 'stirling', 'bessel')
+MAX_PYTHON_NODES = 2000
+MAX_WORK = 10 ** 8
+MODULE_FUNCTIONS = {
+    'lagrange': lagrange_interpolation,
+    'newton_divided': newton_divided,
+    'newton_finite': newton_finite,
+    'stirling': stirling_interpolation,
+    'bessel': bessel_interpolation,
+}
+
+
+class NullGui:
+    def __getattr__(self, name):
+        return lambda *args: None
+
+
+def make_grid(grid, n):
+    if grid == 'uniform':
+        x = np.linspace(-1.0, 1.0, n)
+    else:
+        x = np.sort(np.cos(np.pi * (2 * np.arange(n) + 1) / (2 * n)))
+    return Dataset(x, np.sin(3 * x) + x * x, is_sorted=True)
+
+
+def make_queries(size):
+    if size == 1:
+        return 0.123
+    return np.linspace(-0.99, 0.99, size)
+
+
+def node_count(method, n):
+    if method == 'stirling':
+        return n | 1
+    if method == 'bessel':
+        return n + n % 2
+    return n
+
+
+def cold(func):
+    def run():
+        FIT_CACHE.clear()
+        return func()
+    return run
+
+
+def consume(iterable):
+    for _ in iterable:
+        pass
+
+
+def cases(node_counts, query_sizes):
+    for n in node_counts:
+        data = make_grid('uniform', n)
+        if n <= MAX_PYTHON_NODES:
+            yield f"build_diff_table/n={n}", lambda data=data: build_diff_table(data)
+            for grid in GRIDS:
+                grid_data = make_grid(grid, n)
+                yield f"build_divided_diff/{grid}/n={n}", lambda data=grid_data: build_divided_diff(data)
+        yield f"iter_diff_levels/n={n}", lambda data=data: consume(iter_diff_levels(data))
+        yield f"load_dataset/func/n={n}", cold(lambda n=n: load_dataset(
+            'func', {'name': 'sin(x)', 'left': -1.0, 'right': 1.0, 'n': n}
+        ))
+
+    for method in INTERPOLANTS:
+        grids = ('uniform',) if method in FINITE_METHODS else GRIDS
+        for grid in grids:
+            for n in node_counts:
+                data = make_grid(grid, node_count(method, n))
+                cls = INTERPOLANTS[method]
+                yield f"fit/{method}/{grid}/n={len(data)}", lambda cls=cls, data=data: cls.fit(data)
+                if len(data) <= MAX_PYTHON_NODES:
+                    call = cold(lambda func=MODULE_FUNCTIONS[method], data=data: func(data, 0.123))
+                    yield f"function/{method}/{grid}/n={len(data)}", call
+                try:
+                    fitted = cls.fit(data)
+                except Exception:
+                    continue
+                for size in query_sizes:
+                    if len(data) * size <= MAX_WORK:
+                        xs = make_queries(size)
+                        yield (f"evaluate/{method}/{grid}/n={len(data)}/q={size}",
+                               lambda fitted=fitted, xs=xs: fitted.evaluate(xs))
+
+    for grid in GRIDS:
+        for n in node_counts:
+            auto = AutoInterpolant(make_grid(grid, n))
+            for size in query_sizes:
+                if n * size <= MAX_WORK:
+                    xs = make_queries(size)
+                    yield f"evaluate/auto/{grid}/n={n}/q={size}", lambda auto=auto, xs=xs: auto.evaluate(xs)
+
+    for method in INTERPOLANTS:
+        for n in node_counts:
+            if n < 50:
+                continue
+            data = make_grid('uniform', n)
+            local = LocalInterpolant(data, method, 8)
+            for size in query_sizes:
+                xs = make_queries(size)
+                yield f"local/{method}/n={n}/q={size}", lambda local=local, xs=xs: local.evaluate(xs)
+
+    for method in INTERPOLANTS:
+        for n in node_counts:
+            n = node_count(method, n)
+            if n > MAX_PYTHON_NODES:
+                continue
+            x = np.linspace(-1.0, 1.0, n)
+            Y = np.sin(np.outer(x, np.arange(1, 9)))
+            xs = make_queries(1000)
+            yield (f"series/{method}/n={n}/m=8/q=1000",
+                   lambda x=x, Y=Y, method=method, xs=xs: SeriesInterpolant.fit(x, Y, method).evaluate(xs))
+
+    fitted = INTERPOLANTS['newton_divided'].fit(make_grid('uniform', 50))
+    yield "adaptive_samples/newton_divided/n=50", lambda: adaptive_samples(fitted.evaluate, -1.0, 1.0)
+
+    data = make_grid('uniform', 51)
+    xs = make_queries(QUERY_SIZES[-1])
+    yield "iter_results/n=51/q=100000", lambda: consume(iter_results(data, RESULT_METHODS, xs))
+
+    for n in node_counts:
+        if n > MAX_PYTHON_NODES:
+            continue
+        methods = {method: applicable(method, n) for method in INTERPOLANTS}
+        yield f"execute_interpolation/n={n}", cold(lambda n=n, methods=methods: execute_interpolation(
+            'func', {'name': 'sin(x)', 'left': -1.0, 'right': 1.0, 'n': n}, methods, 0.123, NullGui()
+        ))
+
+
+def applicable(method, n):
+    try:
+        check_method(method, range(n))
+    except ValueError:
+        return False
+    return True
+
+
+def file_cases(node_counts, directory):
+    for n in node_counts:
+        path = os.path.join(directory, f"nodes_{n}.csv")
+        data = make_grid('uniform', n)
+        np.savetxt(path, np.column_stack([data.x, data.y]), delimiter=',', fmt='%.17g')
+        yield f"read_nodes/n={n}", lambda path=path: read_nodes(path)
+
+
+def startup_cases():
+    for name, code in [('import_main', "import main"), ('import_plotting', "import main; main.import_plotting()")]:
+        yield f"startup/{name}", lambda code=code: subprocess.run([sys.executable, '-c', code], cwd=HERE, check=True)
+
+
+def measure(func, min_time=0.05, repeat=3):
+    number = 1
+    while True:
+        elapsed = timed(func, number)
+        if elapsed >= min_time or number >= 10 ** 6:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = min([elapsed] + [timed(func, number) for _ in range(repeat - 1)])
+    return best / number
+
+
+def timed(func, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def settle_allocator():
+    # freeing a 16 MiB block raises glibc's mmap threshold, so large temporaries come from the heap
+    # in every run instead of depending on which cases happened to run before
+    np.ones(2 ** 21)
+
+
+def run(node_counts, query_sizes, pattern=None, min_time=0.05, repeat=3, out=sys.stderr):
+    results = {}
+    errors = {}
+    settle_allocator()
+    with tempfile.TemporaryDirectory() as directory, np.errstate(all='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for key, func in itertools.chain(
+            cases(node_counts, query_sizes), file_cases(node_counts, directory), startup_cases()
+        ):
+            if pattern and pattern not in key:
+                continue
+            try:
+                results[key] = measure(func, min_time, repeat)
+            except Exception as e:
+                errors[key] = f"{type(e).__name__}: {e}"
+                print(f"{key}: {errors[key]}", file=out)
+                continue
+            print(f"{key}: {results[key] * 1e3:.4f} мс", file=out)
+    return results, errors
+
+
+def metadata():
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'processor': platform.processor(),
+        'cpus': os.cpu_count(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def compare(results, errors, baseline, threshold, min_delta):
+    regressions = [(key, baseline[key], None) for key in errors if key in baseline]
+    for key, value in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if value > base * (1 + threshold) and value - base > min_delta:
+            regressions.append((key, base, value))
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Бенчмарки методов интерполяции")
+    parser.add_argument('--quick', action='store_true', help="только малые размеры (n ≤ 500)")
+    parser.add_argument('--filter', help="запускать только случаи, содержащие подстроку")
+    parser.add_argument('--min-time', type=float, default=0.05, help="минимальное время одного замера, с")
+    parser.add_argument('--repeat', type=int, default=5, help="число замеров (берётся лучший)")
+    parser.add_argument('--output', help="записать результаты в JSON")
+    parser.add_argument('--baseline', default=BASELINE, help="JSON с эталонными результатами")
+    parser.add_argument('--save-baseline', action='store_true', help="перезаписать эталон текущими результатами")
+    parser.add_argument('--threshold', type=float, default=0.5, help="допустимое замедление (0.5 — на 50%%)")
+    parser.add_argument('--min-delta', type=float, default=1e-6, help="игнорировать разницу меньше, с")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    node_counts = QUICK_NODE_COUNTS if args.quick else NODE_COUNTS
+    results, errors = run(node_counts, QUERY_SIZES, args.filter, args.min_time, args.repeat)
+    payload = {'meta': metadata(), 'results': results, 'errors': errors}
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)['results']
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'meta': metadata(), 'results': baseline}, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"Эталон сохранён: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Эталон не найден: {args.baseline}")
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    regressions = compare(results, errors, baseline, args.threshold, args.min_delta)
+    for key, base, value in regressions:
+        if value is None:
+            print(f"РЕГРЕССИЯ {key}: {errors[key]}")
+        else:
+            print(f"РЕГРЕССИЯ {key}: {base * 1e3:.4f} → {value * 1e3:.4f} мс (×{value / base:.2f})")
+    missing = len([key for key in results if key not in baseline])
+    print(f"Сравнено: {len(results) - missing}, новых: {missing}, регрессий: {len(regressions)}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,91 @@
+import queue
+import sys
+import threading
+import time
+
+STARTED = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from solver import *
 
 MAX_POINTS = 20
-FUNCTIONS = ["sin(x)", "cos(x)", "exp(x)"]
+DIFF_COLUMN_WIDTH = 80
+DIFF_HEADER_HEIGHT = 25
+CURVES = [
+    ('newton_divided', "-.", "Ньютон (раздел.)"),
+    ('stirling', ":", "Стирлинг"),
+    ('bessel', "--", "Бессель"),
+    ('lagrange', "-", "Лагранж"),
+    ('newton_finite', "--", "Ньютон (конеч.)"),
+    ('auto', "-", "Авто"),
+]
+
+
+def import_plotting():
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    return Figure, FigureCanvasTkAgg
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class WorkerGui:
+    def __init__(self, app, job, methods, window):
+        self.app = app
+        self.job = job
+        self.methods = methods
+        self.window = window
+
+    def check(self):
+        if self.job != self.app.job:
+            raise JobCancelled()
+
+    def _post(self, name, *args):
+        self.check()
+        self.app.calls.put((self.job, name, args))
+
+    def show_error(self, msg):
+        self._post('show_error', msg)
+
+    def show_ok(self, msg):
+        self._post('show_ok', msg)
+
+    def clear_diff_table(self):
+        self._post('clear_diff_table')
+
+    def update_diff_table(self, table):
+        self._post('update_diff_table', table)
+
+    def clear_results(self):
+        self._post('clear_results')
+
+    def add_result(self, method, value, *stats):
+        self._post('add_result', method, value, *stats)
+
+    def plot(self, points, x0):
+        curves = self.app.compute_curves(points, x0, self.methods, self.window, self.check)
+        self._post('draw_plot', points, x0, curves)
 
 
 class InterpolatorApp:
-    def __init__(self):
+    def __init__(self, startup_time=False):
         self.root = tk.Tk()
         self.root.title("Интерполятор")
         self.root.geometry("1200x700")
 
         self.point_entries = []  
+        self.window = None
+        self.methods = {}
+        self.job = 0
+        self.calls = queue.Queue()
+        self.startup_time = startup_time
         self._build_ui()
+        self.root.after(50, self._poll_calls)
+        self.root.bind("<Map>", self._on_map)
 
         
         self.var_newton_divided.set(True)
@@ -69,6 +138,7 @@ class InterpolatorApp:
         self.var_stirling = tk.BooleanVar()
         self.var_bessel = tk.BooleanVar()
         self.var_newton_finite = tk.BooleanVar()
+        self.var_auto = tk.BooleanVar()
         cb_lagr = ttk.Checkbutton(meth_box, text="Лагранж", variable=self.var_lagr)
         cb_newton = ttk.Checkbutton(meth_box, text="Ньютон (раздел.)", variable=self.var_newton_divided)
         cb_newton_finite = ttk.Checkbutton(
@@ -81,9 +151,19 @@ class InterpolatorApp:
         cb_stirling.pack(anchor=tk.W, pady=2)
         cb_bessel.pack(anchor=tk.W, pady=2)
         cb_newton_finite.pack(anchor=tk.W, pady=2)
+        ttk.Checkbutton(
+            meth_box, text="Авто (один подходящий метод)", variable=self.var_auto
+        ).pack(anchor=tk.W, pady=2)
         btn_all = ttk.Button(meth_box, text="Выбрать всё", command=self._select_all)
         btn_all.pack(pady=5)
 
+        window_frame = ttk.Frame(meth_box)
+        window_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(window_frame, text="Окно k (0 — все узлы)").pack(side=tk.LEFT, padx=(0, 5))
+        self.sb_window = ttk.Spinbox(window_frame, from_=0, to=1000, increment=1, width=6)
+        self.sb_window.set("0")
+        self.sb_window.pack(side=tk.LEFT)
+
         
         xstar_frame = ttk.Frame(left_panel)
         xstar_frame.pack(fill=tk.X, pady=5)
@@ -97,6 +177,8 @@ class InterpolatorApp:
         
         self.btn_solve = ttk.Button(left_panel, text="Решить", command=self._solve)
         self.btn_solve.pack(fill=tk.X, pady=(20, 5))
+        self.progress = ttk.Progressbar(left_panel, mode='indeterminate')
+        self.progress.pack(fill=tk.X, pady=5)
 
         
         self.status_var = tk.StringVar()
@@ -105,11 +187,16 @@ class InterpolatorApp:
         )
         self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
 
-        self.fig = Figure(figsize=(5, 4))
-        self.ax = self.fig.add_subplot(111)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=right_panel)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.grid(row=0, column=0, columnspan=2, sticky="nsew")
+        self.fig = None
+        self.ax = None
+        self.canvas = None
+        self.nodes_line = None
+        self.marker = None
+        self.lines = {}
+        self.curve_keys = {}
+        self.plot_key = None
+        self.plot_frame = ttk.Frame(right_panel)
+        self.plot_frame.grid(row=0, column=0, columnspan=2, sticky="nsew")
 
         
         diff_box = ttk.Labelframe(right_panel, text="Таблица конечных разностей")
@@ -128,15 +215,24 @@ class InterpolatorApp:
         frame_diff = ttk.Frame(diff_box)
         frame_diff.pack(fill=tk.BOTH, expand=True)
 
+        self.diff_data = None
+        self.diff_row = 0
+        self.diff_col = 0
+        self.diff_visible_rows = 10
+        self.diff_visible_cols = 8
         self.diff_tree = ttk.Treeview(frame_diff, show='headings')
-        v_scroll = ttk.Scrollbar(frame_diff, orient=tk.VERTICAL, command=self.diff_tree.yview)
-        h_scroll = ttk.Scrollbar(frame_diff, orient=tk.HORIZONTAL, command=self.diff_tree.xview)
-        self.diff_tree.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+        self.diff_vscroll = ttk.Scrollbar(frame_diff, orient=tk.VERTICAL, command=self._diff_yview)
+        self.diff_hscroll = ttk.Scrollbar(frame_diff, orient=tk.HORIZONTAL, command=self._diff_xview)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.diff_tree.bind(sequence, self._diff_wheel)
+        self.diff_tree.bind("<Configure>", self._diff_resize)
 
         
         self.diff_tree.grid(row=0, column=0, sticky="nsew")
-        v_scroll.grid(row=0, column=1, sticky="ns")
-        h_scroll.grid(row=1, column=0, columnspan=2, sticky="ew")
+        self.diff_vscroll.grid(row=0, column=1, sticky="ns")
+        self.diff_hscroll.grid(row=1, column=0, columnspan=2, sticky="ew")
+        btn_export = ttk.Button(frame_diff, text="Экспорт…", command=self._export_diff_table)
+        btn_export.grid(row=2, column=0, columnspan=2, sticky="e", pady=(5, 0))
 
         frame_diff.rowconfigure(0, weight=1)
         frame_diff.columnconfigure(0, weight=1)
@@ -145,17 +241,30 @@ class InterpolatorApp:
         frame_res = ttk.Frame(results_box)
         frame_res.pack(fill=tk.BOTH, expand=True)
 
-        self.res_tree = ttk.Treeview(frame_res, columns=("method", "value"), show='headings')
+        self.res_tree = ttk.Treeview(
+            frame_res, columns=("method", "value", "time", "calls", "peak"), show='headings'
+        )
         self.res_tree.heading("method", text="Метод")
         self.res_tree.heading("value", text="Значение")
-        self.res_tree.column("method", anchor=tk.W)
-        self.res_tree.column("value", anchor=tk.E)
+        self.res_tree.heading("time", text="Время, мс")
+        self.res_tree.heading("calls", text="Вызовы")
+        self.res_tree.heading("peak", text="Пик, КиБ")
+        self.res_tree.column("method", anchor=tk.W, width=120)
+        self.res_tree.column("value", anchor=tk.E, width=90)
+        for column in ("time", "calls", "peak"):
+            self.res_tree.column(column, anchor=tk.E, width=70)
         v_scroll_res = ttk.Scrollbar(frame_res, orient=tk.VERTICAL, command=self.res_tree.yview)
         self.res_tree.configure(yscrollcommand=v_scroll_res.set)
 
         self.res_tree.grid(row=0, column=0, sticky="nsew")
         v_scroll_res.grid(row=0, column=1, sticky="ns")
 
+        profile_frame = ttk.Frame(frame_res)
+        profile_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(5, 0))
+        self.var_profile = tk.BooleanVar()
+        ttk.Checkbutton(profile_frame, text="Профилирование", variable=self.var_profile).pack(side=tk.LEFT)
+        ttk.Button(profile_frame, text="Профиль…", command=self._export_profile).pack(side=tk.RIGHT)
+
         frame_res.rowconfigure(0, weight=1)
         frame_res.columnconfigure(0, weight=1)
 
@@ -194,7 +303,7 @@ class InterpolatorApp:
         row1 = ttk.Frame(self.page_func)
         row1.pack(fill=tk.X, pady=2)
         ttk.Label(row1, text="f(x) =").pack(side=tk.LEFT, padx=(0, 5))
-        self.cmb_func = ttk.Combobox(row1, values=FUNCTIONS, state="readonly")
+        self.cmb_func = ttk.Combobox(row1, values=list(MATH_FUNCTIONS), state="readonly")
         self.cmb_func.current(0)
         self.cmb_func.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
@@ -216,6 +325,12 @@ class InterpolatorApp:
         self.sb_n.set("5")
         self.sb_n.pack(side=tk.LEFT)
 
+        row4 = ttk.Frame(self.page_func)
+        row4.pack(fill=tk.X, pady=2)
+        ttk.Label(row4, text="Точность ε (пусто — ровно N точек)").pack(side=tk.LEFT, padx=(0, 5))
+        self.le_tol = ttk.Entry(row4, width=10)
+        self.le_tol.pack(side=tk.LEFT)
+
     def _switch_page(self):
         mode = self.var_input_mode.get()
         for child in self.pages_container.winfo_children():
@@ -258,7 +373,9 @@ class InterpolatorApp:
         self.var_bessel.set(True)
 
     def _browse_file(self):
-        path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt *.csv"), ("All files", "*.*")])
+        path = filedialog.askopenfilename(filetypes=[
+            ("Text files", "*.txt *.csv"), ("Binary files", "*.npy *.f64 *.bin *.raw"), ("All files", "*.*")
+        ])
         if path:
             self.le_path.config(state='normal')
             self.le_path.delete(0, tk.END)
@@ -268,43 +385,134 @@ class InterpolatorApp:
     
     
     def clear_diff_table(self):
-        for item in self.diff_tree.get_children():
-            self.diff_tree.delete(item)
+        self.diff_tree.delete(*self.diff_tree.get_children())
         self.diff_tree["columns"] = ()
         self.diff_tree["show"] = "headings"
+        self.diff_data = None
+        self.diff_row = 0
+        self.diff_col = 0
+        self.diff_vscroll.set(0.0, 1.0)
+        self.diff_hscroll.set(0.0, 1.0)
 
-    def update_diff_table(self, diffs):
+    def update_diff_table(self, table):
         self.clear_diff_table()
-        if not diffs:
+        if table is None or table.rows == 0 or table.cols == 0:
             return
+        self.diff_data = table
+        self._render_diff_table()
+
+    def _render_diff_table(self):
+        table = self.diff_data
+        rows = table.rows
+        cols = table.cols
+        if rows == 0 or cols == 0:
+            return
+        col_stop = min(self.diff_col + self.diff_visible_cols, cols)
+        row_stop = min(self.diff_row + self.diff_visible_rows, rows)
+
+        headers = ["y" if c == 0 else f"Δ^{c}" for c in range(self.diff_col, col_stop)]
+        if list(self.diff_tree["columns"]) != headers:
+            self.diff_tree["columns"] = headers
+            for h in headers:
+                self.diff_tree.heading(h, text=h)
+                self.diff_tree.column(h, anchor=tk.E, width=DIFF_COLUMN_WIDTH, stretch=False)
+
+        items = self.diff_tree.get_children()
+        needed = row_stop - self.diff_row
+        if len(items) > needed:
+            self.diff_tree.delete(*items[needed:])
+            items = items[:needed]
+        block = table.block(self.diff_row, row_stop, self.diff_col, col_stop)
+        for k, values in enumerate(block):
+            row_vals = ["" if value is None else f"{value:.6g}" for value in values]
+            if k < len(items):
+                self.diff_tree.item(items[k], values=row_vals)
+            else:
+                self.diff_tree.insert("", tk.END, values=row_vals)
+
+        self.diff_vscroll.set(self.diff_row / rows, row_stop / rows)
+        self.diff_hscroll.set(self.diff_col / cols, col_stop / cols)
+
+    def _diff_scroll(self, attr, total, visible, args):
+        current = getattr(self, attr)
+        if args[0] == 'moveto':
+            new = int(float(args[1]) * total)
+        else:
+            step = visible if args[2] == 'pages' else 1
+            new = current + int(args[1]) * step
+        new = max(0, min(new, total - visible))
+        if new != current:
+            setattr(self, attr, new)
+            self._render_diff_table()
+
+    def _diff_yview(self, *args):
+        if self.diff_data:
+            rows = self.diff_data.rows
+            self._diff_scroll('diff_row', rows, min(self.diff_visible_rows, rows), args)
+
+    def _diff_xview(self, *args):
+        if self.diff_data:
+            cols = self.diff_data.cols
+            self._diff_scroll('diff_col', cols, min(self.diff_visible_cols, cols), args)
+
+    def _diff_resize(self, event):
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        rows = max(1, (event.height - DIFF_HEADER_HEIGHT) // row_height)
+        cols = max(1, event.width // DIFF_COLUMN_WIDTH)
+        if (rows, cols) != (self.diff_visible_rows, self.diff_visible_cols):
+            self.diff_visible_rows = rows
+            self.diff_visible_cols = cols
+            if self.diff_data:
+                self._diff_yview('scroll', 0, 'units')
+                self._render_diff_table()
+
+    def _diff_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self._diff_yview('scroll', -3, 'units')
+        else:
+            self._diff_yview('scroll', 3, 'units')
+        return "break"
 
-        cols = len(diffs)
-        rows = max(len(col) for col in diffs)
-
-        headers = ["y"] + [f"Δ^{i}" for i in range(1, cols)]
-        self.diff_tree["columns"] = headers
+    def _export_diff_table(self):
+        if not self.diff_data:
+            self.show_error("Таблица разностей пуста")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV", "*.csv")])
+        if not path:
+            return
+        table = self.diff_data
+        job = self.job
 
-        for h in headers:
-            self.diff_tree.heading(h, text=h)
-            self.diff_tree.column(h, anchor=tk.E, width=80, stretch=False)
+        def work():
+            try:
+                export_diff_table(table, path)
+                self.calls.put((job, 'show_ok', (f"Таблица сохранена: {path}",)))
+            except Exception as e:
+                self.calls.put((job, 'show_error', (str(e),)))
 
-        for r in range(rows):
-            row_vals = []
-            for c in range(cols):
-                if r < len(diffs[c]):
-                    row_vals.append(f"{diffs[c][r]:.6g}")
-                else:
-                    row_vals.append("")
-            self.diff_tree.insert("", tk.END, values=row_vals)
+        threading.Thread(target=work, daemon=True).start()
 
     
     
     def clear_results(self):
-        for item in self.res_tree.get_children():
-            self.res_tree.delete(item)
+        self.res_tree.delete(*self.res_tree.get_children())
 
-    def add_result(self, method, value):
-        self.res_tree.insert("", tk.END, values=(method, value))
+    def add_result(self, method, value, *stats):
+        self.res_tree.insert("", tk.END, values=(method, value) + stats)
+
+    def _export_profile(self):
+        if not PROFILER.stats:
+            self.show_error("Профиль пуст: включите профилирование и выполните расчёт")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        try:
+            PROFILER.export_json(path)
+        except Exception as e:
+            self.show_error(str(e))
+            return
+        self.show_ok(f"Профиль сохранён: {path}")
 
     
     
@@ -321,48 +529,142 @@ class InterpolatorApp:
 
 
     def plot(self, points, x0):
-        if not points:
-            self.ax.clear()
-            self.canvas.draw()
-            return
+        self.draw_plot(points, x0, self.compute_curves(points, x0, self.methods, self.window))
 
-        self.ax.clear()
-        xs, ys = zip(*points)
-        self.ax.scatter(xs, ys, label="Узлы")
-
-        x_min, x_max = xs[0], xs[-1]
-        xx = [x_min + i * (x_max - x_min) / 300 for i in range(301)]
-
-
-        if self.var_newton_divided.get():
-            yy_g = [newton_divided(points, x) for x in xx]
-            self.ax.plot(xx, yy_g, linestyle="-.", label="Ньютон (раздел.)")
-        if self.var_stirling.get():
-            yy_s = [stirling_interpolation(points, x) for x in xx]
-            self.ax.plot(xx, yy_s, linestyle=":", label="Стирлинг")
-        if self.var_bessel.get():
-            yy_b = [bessel_interpolation(points, x) for x in xx]
-            self.ax.plot(xx, yy_b, linestyle="--", label="Бессель")
-        if self.var_lagr.get():
-            yy_l = [lagrange_interpolation(points, x) for x in xx]
-            self.ax.plot(xx, yy_l, linestyle="-", label="Лагранж")
-        if self.var_newton_finite.get():
-            yy_n = [newton_finite(points, x) for x in xx]
-            self.ax.plot(xx, yy_n, linestyle="--", label="Ньютон (конеч.)")
+    def compute_curves(self, points, x0, methods, window, check=None):
+        if not points:
+            return None
+        curves = []
+        for method, style, label in CURVES:
+            if methods.get(method):
+                if check:
+                    check()
+                xx, yy = cached_curve(points, method, window)
+                curves.append((method, xx, yy, style, label))
 
         try:
-            y0 = newton_divided(points, x0)
-            self.ax.scatter([x0], [y0], marker="x", s=100, label=f"x*={x0:.4g}")
+            y0 = fitted_interpolant(points, 'newton_divided', window).evaluate(x0)
         except Exception:
-            y0 = newton_finite(points, x0)
-            self.ax.scatter([x0], [y0], marker="x", s=100, label=f"x*={x0:.4g}")
+            y0 = fitted_interpolant(points, 'newton_finite', window).evaluate(x0)
+        return curves, y0
 
+    def _preload_plotting(self):
+        import_plotting()
+        self.calls.put((self.job, '_ensure_plot', ()))
+
+    def _ensure_plot(self):
+        if self.canvas is not None:
+            return
+        Figure, FigureCanvasTkAgg = import_plotting()
+        self.fig = Figure(figsize=(5, 4))
+        self.ax = self.fig.add_subplot(111)
         self.ax.set_xlabel("x")
         self.ax.set_ylabel("y")
         self.ax.set_title("Интерполяция")
-        self.ax.legend()
         self.ax.grid(True)
-        self.canvas.draw()
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
+        self.canvas_widget = self.canvas.get_tk_widget()
+        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+
+    def draw_plot(self, points, x0, curves):
+        self._ensure_plot()
+        if curves is None:
+            self._reset_plot()
+            self.canvas.draw_idle()
+            return
+
+        curves, y0 = curves
+        key = points.fingerprint()
+        changed = key != self.plot_key
+        if self.nodes_line is None:
+            self.nodes_line, = self.ax.plot(points.x, points.y, "o", label="Узлы")
+            changed = True
+        elif changed:
+            self.nodes_line.set_data(points.x, points.y)
+
+        shown = set()
+        for method, xx, yy, style, label in curves:
+            curve_key = (key, self.window)
+            line = self.lines.get(method)
+            if line is None:
+                self.lines[method], = self.ax.plot(xx, yy, linestyle=style, label=label)
+                changed = True
+            elif self.curve_keys.get(method) != curve_key:
+                line.set_data(xx, yy)
+                changed = True
+            self.curve_keys[method] = curve_key
+            shown.add(method)
+        for method in list(self.lines):
+            if method not in shown:
+                self.lines.pop(method).remove()
+                self.curve_keys.pop(method)
+
+        if self.marker is None:
+            self.marker, = self.ax.plot([x0], [y0], "x", markersize=10)
+        else:
+            self.marker.set_data([x0], [y0])
+        self.marker.set_label(f"x*={x0:.4g}")
+
+        if changed:
+            self.ax.relim()
+            self.ax.autoscale_view()
+        self.plot_key = key
+        self.ax.legend()
+        self.canvas.draw_idle()
+
+    def _reset_plot(self):
+        for artist in [self.nodes_line, self.marker] + list(self.lines.values()):
+            if artist is not None:
+                artist.remove()
+        self.nodes_line = None
+        self.marker = None
+        self.lines = {}
+        self.curve_keys = {}
+        self.plot_key = None
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+
+    
+    
+    def _on_map(self, event):
+        if event.widget is not self.root:
+            return
+        self.root.unbind("<Map>")
+        elapsed = time.perf_counter() - STARTED
+        if self.startup_time:
+            print(f"Окно показано через {elapsed * 1000:.0f} мс", file=sys.stderr)
+            self.root.after_idle(self.root.destroy)
+            return
+        threading.Thread(target=self._preload_plotting, daemon=True).start()
+
+    def _poll_calls(self):
+        try:
+            while True:
+                try:
+                    job, name, args = self.calls.get_nowait()
+                except queue.Empty:
+                    break
+                if job != self.job:
+                    continue
+                try:
+                    getattr(self, name)(*args)
+                except Exception as e:
+                    self.show_error(f"{name}: {e}")
+        finally:
+            self.root.after(50, self._poll_calls)
+
+    def _run_job(self, gui, data_kind, data, xstar):
+        try:
+            execute_interpolation(data_kind, data, gui.methods, xstar, gui, window=gui.window)
+        except JobCancelled:
+            return
+        except Exception as e:
+            self.calls.put((gui.job, 'show_error', (str(e),)))
+        self.calls.put((gui.job, '_finish_job', ()))
+
+    def _finish_job(self):
+        self.progress.stop()
 
     
     
@@ -402,12 +704,17 @@ class InterpolatorApp:
                     raise ValueError("Правая граница ≤ левой")
                 if count < 2:
                     raise ValueError("Для режима «Функция» нужно N ≥ 2")
+                tol_text = self.le_tol.get().strip()
+                tolerance = float(tol_text) if tol_text else None
+                if tolerance is not None and (tolerance <= 0 or count < 3):
+                    raise ValueError("Для подбора узлов нужна точность > 0 и N ≥ 3")
                 data_kind = 'func'
                 data = {
                     'name': self.cmb_func.get(),
                     'left': left,
                     'right': right,
-                    'n': count
+                    'n': count,
+                    'tolerance': tolerance
                 }
         except Exception as e:
             self.show_error(str(e))
@@ -421,6 +728,10 @@ class InterpolatorApp:
             'newton_finite': self.var_newton_finite.get(),
             'bessel': self.var_bessel.get()
         }
+        if self.var_auto.get():
+            methods = {'auto': True}
+        if data_kind == 'func' and any(methods.get(method) for method in UNIFORM_METHODS):
+            data['kinds'] = ('equispaced',)
 
         try:
             xstar = float(self.sb_xstar.get())
@@ -429,11 +740,27 @@ class InterpolatorApp:
             return
 
         try:
-            execute_interpolation(data_kind, data, methods, xstar, self)
-        except Exception as e:
-            self.show_error(str(e))
+            window = int(self.sb_window.get())
+            if window < 0 or window == 1:
+                raise ValueError
+        except Exception:
+            self.show_error("Окно k должно быть 0 или ≥ 2")
+            return
+        self.window = window or None
+        self.methods = methods
+        if self.var_profile.get():
+            PROFILER.enable(memory=True)
+        else:
+            PROFILER.disable()
+        PROFILER.reset()
+
+        self.job += 1
+        gui = WorkerGui(self, self.job, methods, self.window)
+        worker = threading.Thread(target=self._run_job, args=(gui, data_kind, data, xstar), daemon=True)
+        self.progress.start(10)
+        worker.start()
 
 
 
 if __name__ == "__main__":
-    InterpolatorApp()
\ No newline at end of file
+    InterpolatorApp(startup_time='--startup-time' in sys.argv[1:])
\ No newline at end of file
@@ -0,0 +1,124 @@
+import contextlib
+import io
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+MIN_PARALLEL = 200_000
+SHARE_THRESHOLD = 4096
+
+_worker = {}
+
+
+def share_array(arr):
+    arr = np.asarray(arr)
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[...] = arr
+    del view
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+
+def attach_array(desc):
+    name, shape, dtype = desc
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+class SharedPickler(pickle.Pickler):
+    def __init__(self, file, blocks):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.blocks = blocks
+
+    def persistent_id(self, obj):
+        if isinstance(obj, np.ndarray) and obj.dtype.kind in 'biuf' and obj.size >= SHARE_THRESHOLD:
+            shm, desc = share_array(obj)
+            self.blocks.append(shm)
+            return desc
+        return None
+
+
+class SharedUnpickler(pickle.Unpickler):
+    def __init__(self, file, blocks):
+        super().__init__(file)
+        self.blocks = blocks
+
+    def persistent_load(self, desc):
+        shm, arr = attach_array(desc)
+        self.blocks.append(shm)
+        return arr
+
+
+def _attach_job(job):
+    if _worker.get('job') == job:
+        return
+    blocks = _worker.pop('blocks', [])
+    _worker.clear()
+    for shm in blocks:
+        with contextlib.suppress(BufferError):
+            shm.close()
+    payload_name, payload_size, query_desc, out_desc = job
+    blocks = []
+    payload = shared_memory.SharedMemory(name=payload_name)
+    blocks.append(payload)
+    data = bytes(payload.buf[:payload_size])
+    _worker['interpolant'] = SharedUnpickler(io.BytesIO(data), blocks).load()
+    for key, desc in (('query', query_desc), ('out', out_desc)):
+        shm, _worker[key] = attach_array(desc)
+        blocks.append(shm)
+    _worker['blocks'] = blocks
+    _worker['job'] = job
+
+
+def _evaluate_chunk(job, start, stop):
+    _attach_job(job)
+    _worker['out'][start:stop] = _worker['interpolant'].evaluate(_worker['query'][start:stop])
+    return stop - start
+
+
+def evaluate_parallel(interpolant, xs, workers=None, min_size=MIN_PARALLEL, pool=None):
+    xs = np.asarray(xs, dtype=float)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or xs.size < min_size:
+        return np.asarray(interpolant.evaluate(xs), dtype=float)
+
+    prepare = getattr(interpolant, 'prepare', None)
+    if prepare is not None:
+        prepare(xs)
+    blocks = []
+    try:
+        buf = io.BytesIO()
+        SharedPickler(buf, blocks).dump(interpolant)
+        payload = buf.getvalue()
+        payload_shm = shared_memory.SharedMemory(create=True, size=len(payload))
+        blocks.append(payload_shm)
+        payload_shm.buf[:len(payload)] = payload
+
+        query_shm, query_desc = share_array(xs.ravel())
+        blocks.append(query_shm)
+        out_shm, out_desc = share_array(np.zeros(xs.size))
+        blocks.append(out_shm)
+
+        chunk = -(-xs.size // (workers * 4))
+        starts = list(range(0, xs.size, chunk))
+        stops = [min(start + chunk, xs.size) for start in starts]
+        jobs = [(payload_shm.name, len(payload), query_desc, out_desc)] * len(starts)
+        if pool is None:
+            with ProcessPoolExecutor(workers) as own:
+                for _ in own.map(_evaluate_chunk, jobs, starts, stops):
+                    pass
+        else:
+            for _ in pool.map(_evaluate_chunk, jobs, starts, stops):
+                pass
+
+        out = np.ndarray(xs.size, dtype=float, buffer=out_shm.buf)
+        result = out.reshape(xs.shape).copy()
+        del out
+        return result
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,264 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from parallel import evaluate_parallel
+from solver import (
+    AUTO, FIT_CACHE, INTERPOLANTS, MATH_FUNCTIONS, Dataset, check_method, fitted_interpolant, load_dataset
+)
+
+BATCH_DELAY = 0.002
+MAX_BODY = 64 * 2 ** 20
+
+
+class ServiceError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def evaluate_batch(data, method, window, xs, workers=None, pool=None):
+    check_method(method, data, window)
+    return evaluate_parallel(fitted_interpolant(data, method, window), xs, workers, pool=pool)
+
+
+class Batcher:
+    def __init__(self, delay=BATCH_DELAY, workers=None, pool=None):
+        self.delay = delay
+        self.workers = workers
+        self.pool = pool
+        self.batches = 0
+        self.requests = 0
+        self._pending = {}
+        self._tasks = set()
+
+    async def evaluate(self, data, method, window, xs):
+        future = asyncio.get_running_loop().create_future()
+        key = (data.fingerprint(), method, window)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            task = asyncio.ensure_future(self._flush(key, data, method, window))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        batch.append((xs, future))
+        return await future
+
+    async def _flush(self, key, data, method, window):
+        await asyncio.sleep(self.delay)
+        batch = self._pending.pop(key)
+        self.batches += 1
+        self.requests += len(batch)
+        xs = np.concatenate([part for part, _ in batch])
+        loop = asyncio.get_running_loop()
+        try:
+            values = await loop.run_in_executor(
+                None, evaluate_batch, data, method, window, xs, self.workers, self.pool
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        bounds = np.cumsum([len(part) for part, _ in batch])[:-1]
+        for (_, future), part in zip(batch, np.split(values, bounds)):
+            if not future.done():
+                future.set_result(part)
+
+
+class InterpolationService:
+    def __init__(self, batcher=None):
+        self.batcher = batcher or Batcher()
+        self.datasets = {}
+
+    async def register(self, payload):
+        loop = asyncio.get_running_loop()
+        if 'file' in payload:
+            data = await loop.run_in_executor(None, load_dataset, 'file', payload['file'])
+        elif 'func' in payload:
+            source = {
+                'name': payload['func'],
+                'left': float(payload.get('left', -3.14)),
+                'right': float(payload.get('right', 3.14)),
+                'n': int(payload.get('n', 5)),
+                'tolerance': payload.get('tolerance'),
+            }
+            if source['n'] < 2 or source['right'] <= source['left']:
+                raise ValueError("Для режима «Функция» нужно N ≥ 2 и левая граница < правой")
+            data = await loop.run_in_executor(None, load_dataset, 'func', source)
+        else:
+            data = Dataset(payload['x'], payload['y']).sorted()
+        if len(data) < 2:
+            raise ValueError("Необходимо минимум 2 точки")
+        if np.any(data.x[1:] == data.x[:-1]):
+            raise ValueError("Узлы x не должны повторяться")
+        handle = data.fingerprint()
+        self.datasets[handle] = data
+        return self.describe(handle)
+
+    def dataset(self, handle):
+        data = self.datasets.get(handle)
+        if data is None:
+            raise ServiceError(HTTPStatus.NOT_FOUND, f"Неизвестный набор узлов: {handle}")
+        return data
+
+    def describe(self, handle):
+        data = self.dataset(handle)
+        return {
+            'handle': handle,
+            'n': len(data),
+            'left': float(data.x[0]),
+            'right': float(data.x[-1]),
+            'uniform': data.is_uniform,
+        }
+
+    async def evaluate(self, handle, payload):
+        data = self.dataset(handle)
+        method = payload.get('method', 'newton_divided')
+        if method not in INTERPOLANTS and method != AUTO:
+            raise ValueError(f"Неизвестный метод: {method}")
+        window = int(payload.get('window') or 0)
+        if window < 0 or window == 1:
+            raise ValueError("Окно k должно быть 0 или ≥ 2")
+        xs = np.asarray(payload['x'], dtype=float)
+        values = await self.batcher.evaluate(data, method, window or None, xs.ravel())
+        if xs.ndim == 0:
+            return {'y': float(values[0])}
+        return {'y': values.reshape(xs.shape).tolist()}
+
+    def stats(self):
+        return {
+            'datasets': len(self.datasets),
+            'requests': self.batcher.requests,
+            'batches': self.batcher.batches,
+            'cache_hits': FIT_CACHE.hits,
+            'cache_misses': FIT_CACHE.misses,
+            'cache_rejected': FIT_CACHE.rejected,
+        }
+
+    async def dispatch(self, verb, target, body):
+        parts = [part for part in urlsplit(target).path.split('/') if part]
+        payload = json.loads(body) if body else {}
+        if verb == 'GET' and parts == ['methods']:
+            return HTTPStatus.OK, {'methods': list(INTERPOLANTS) + [AUTO], 'functions': list(MATH_FUNCTIONS)}
+        if verb == 'GET' and parts == ['stats']:
+            return HTTPStatus.OK, self.stats()
+        if verb == 'POST' and parts == ['datasets']:
+            return HTTPStatus.CREATED, await self.register(payload)
+        if len(parts) == 2 and parts[0] == 'datasets':
+            if verb == 'GET':
+                return HTTPStatus.OK, self.describe(parts[1])
+            if verb == 'DELETE':
+                self.dataset(parts[1])
+                del self.datasets[parts[1]]
+                return HTTPStatus.OK, {'deleted': parts[1]}
+        if verb == 'POST' and len(parts) == 3 and parts[0] == 'datasets' and parts[2] == 'evaluate':
+            return HTTPStatus.OK, await self.evaluate(parts[1], payload)
+        raise ServiceError(HTTPStatus.NOT_FOUND, f"Неизвестный запрос: {verb} {target}")
+
+    async def respond(self, verb, target, body):
+        try:
+            return await self.dispatch(verb, target, body)
+        except ServiceError as e:
+            return e.status, {'error': str(e)}
+        except (ValueError, KeyError, TypeError, OSError) as e:
+            return HTTPStatus.BAD_REQUEST, {'error': str(e)}
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except ServiceError as e:
+                    write_response(writer, e.status, {'error': str(e)}, False)
+                    break
+                if request is None:
+                    break
+                verb, target, keep_alive, body = request
+                status, payload = await self.respond(verb, target, body)
+                write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def read_request(reader):
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        verb, target, version = line.decode('latin-1').split()
+    except ValueError:
+        raise ServiceError(HTTPStatus.BAD_REQUEST, "Некорректная строка запроса")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length') or 0)
+    if length > MAX_BODY:
+        raise ServiceError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Слишком большой запрос")
+    body = await reader.readexactly(length) if length else b''
+    connection = headers.get('connection', '').lower()
+    keep_alive = connection == 'keep-alive' or (version == 'HTTP/1.1' and connection != 'close')
+    return verb.upper(), target, keep_alive, body
+
+
+def write_response(writer, status, payload, keep_alive):
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode('latin-1') + body)
+
+
+async def serve(host, port, service):
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Сервис интерполяции: http://{address[0]}:{address[1]}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Локальный HTTP/JSON-сервис интерполяции")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--batch-delay', type=float, default=BATCH_DELAY, help="окно сбора запросов в пакет, с")
+    parser.add_argument('--workers', type=int, default=0, help="число процессов (0 — все ядра)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    workers = args.workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        service = InterpolationService(Batcher(args.batch_delay, workers, pool))
+        try:
+            asyncio.run(serve(args.host, args.port, service))
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
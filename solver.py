@@ -1,16 +1,108 @@
+import contextlib
+import copy
 import csv
+import hashlib
+import itertools
+import json
 import math
+import threading
+import time
+import tracemalloc
+import warnings
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
 
 
 MATH_FUNCTIONS = {
-    "sin(x)": math.sin,
-    "cos(x)": math.cos,
-    "exp(x)": math.exp,
+    "sin(x)": np.sin,
+    "cos(x)": np.cos,
+    "exp(x)": np.exp,
 }
 
 
+def register_function(name, func, vectorized=True):
+    MATH_FUNCTIONS[name] = func if vectorized else np.vectorize(func, otypes=[float])
+
+
+def _as_query(x):
+    if np.ndim(x) == 0:
+        return x
+    return np.asarray(x, dtype=float)
+
+
+class Dataset:
+    __slots__ = ('x', 'y', 'is_sorted', '_step', '_fingerprint')
+
+    def __init__(self, x, y, is_sorted=None):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        if self.x.shape != self.y.shape or self.x.ndim != 1:
+            raise ValueError("Столбцы x и y должны быть одной длины")
+        if is_sorted is None:
+            is_sorted = bool(np.all(self.x[1:] >= self.x[:-1]))
+        self.is_sorted = is_sorted
+        self._step = False
+        self._fingerprint = None
+
+    @classmethod
+    def from_points(cls, points):
+        arr = np.array(list(points), dtype=float).reshape(-1, 2)
+        return cls(np.ascontiguousarray(arr[:, 0]), np.ascontiguousarray(arr[:, 1]))
+
+    def __len__(self):
+        return len(self.x)
+
+    def __iter__(self):
+        return zip(self.x.tolist(), self.y.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            part = Dataset(self.x[index], self.y[index], self.is_sorted and index.step in (None, 1))
+            if part.is_sorted and self._step:
+                part._step = self._step
+            return part
+        return float(self.x[index]), float(self.y[index])
+
+    def sorted(self):
+        if self.is_sorted:
+            return self
+        order = np.argsort(self.x, kind='stable')
+        return Dataset(self.x[order], self.y[order], True)
+
+    @property
+    def step(self):
+        if self._step is False:
+            self._step = None
+            if self.is_sorted and len(self.x) >= 2:
+                h = self.x[1] - self.x[0]
+                if np.all(np.abs(np.diff(self.x) - h) <= 1e-8):
+                    self._step = float(h)
+        return self._step
+
+    @property
+    def is_uniform(self):
+        return self.step is not None
+
+    def fingerprint(self):
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(self.x.tobytes())
+            digest.update(self.y.tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+
+def as_dataset(data):
+    if isinstance(data, Dataset):
+        return data
+    return Dataset.from_points(data)
+
+
 def build_diff_table(data):
-    table = [[y for _, y in data]]
+    table = [as_dataset(data).y.tolist()]
     for lvl in range(1, len(data)):
         prev = table[-1]
         curr = [prev[i + 1] - prev[i] for i in range(len(prev) - 1)]
@@ -19,9 +111,10 @@ def build_diff_table(data):
 
 
 def build_divided_diff(data):
+    data = as_dataset(data)
     n = len(data)
-    x_vals = [pt[0] for pt in data]
-    dd = [[pt[1]] for pt in data]
+    x_vals = data.x.tolist()
+    dd = [[y] for y in data.y.tolist()]
     for level in range(1, n):
         for i in range(n - level):
             numerator = dd[i + 1][level - 1] - dd[i][level - 1]
@@ -30,258 +123,1363 @@ def build_divided_diff(data):
     return dd
 
 
-def lagrange_interpolation(data, x):
-    total = 0.0
-    n = len(data)
-    for i in range(n):
-        xi = data[i][0]
-        yi = data[i][1]
-        basis = yi
-        for j in range(n):
+def iter_diff_levels(data):
+    buf = np.array(as_dataset(data).y, dtype=float)
+    n = len(buf)
+    for k in range(n):
+        if k > 0:
+            with np.errstate(over='ignore', invalid='ignore'):
+                np.subtract(buf[1:n - k + 1], buf[:n - k], out=buf[:n - k])
+        yield buf[:n - k]
+
+
+def diff_entries(data, picks):
+    entries = []
+    for k, level in enumerate(iter_diff_levels(data)):
+        size = len(level)
+        entries.append({i: float(level[i]) for i in picks(k, size) if 0 <= i < size})
+    return entries
+
+
+DIFF_EXPORT_BUDGET = 32 * 2 ** 20
+
+
+class DiffTable:
+    def __init__(self, data):
+        self.data = as_dataset(data)
+        self.rows = len(self.data)
+        self.cols = len(self.data)
+
+    def __len__(self):
+        return self.cols
+
+    def block(self, row, row_stop, col, col_stop):
+        row_stop = min(row_stop, self.rows)
+        col_stop = min(col_stop, self.cols)
+        if row >= row_stop or col >= col_stop:
+            return []
+        part = self.data[row:row_stop + col_stop - 1]
+        values = np.zeros((row_stop - row, col_stop - col))
+        for k, level in enumerate(iter_diff_levels(part)):
+            if k >= col_stop:
+                break
+            if k >= col:
+                count = min(len(level), len(values))
+                values[:count, k - col] = level[:count]
+        rows = values.tolist()
+        for j, values_row in enumerate(rows):
+            valid = max(len(part) - j - col, 0)
+            if valid < len(values_row):
+                values_row[valid:] = [None] * (len(values_row) - valid)
+        return rows
+
+
+def export_diff_table(table, path):
+    if not isinstance(table, DiffTable):
+        table = DiffTable(table)
+    step = max(1, DIFF_EXPORT_BUDGET // (8 * max(table.cols, 1)))
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["y"] + [f"d{i}" for i in range(1, table.cols)])
+        for start in range(0, table.rows, step):
+            for values in table.block(start, start + step, 0, table.cols):
+                writer.writerow(["" if value is None else repr(value) for value in values])
+
+
+def _filled(x, value):
+    if isinstance(x, np.ndarray):
+        return np.full(x.shape, value)
+    return value
+
+
+def _uniform_step(data):
+    if data.step is None:
+        raise ValueError("Узлы неравномерны: метод конечных разностей недоступен")
+    return data.step
+
+
+WEIGHT_RANGE = 2.0 ** 500
+SMALL_FIT = 64
+LAGRANGE_BLOCK = 2 ** 16
+
+
+def _direct_weights(x_vals, scale):
+    denominators = []
+    for i, xi in enumerate(x_vals):
+        denominator = 1.0
+        for j, xj in enumerate(x_vals):
             if i != j:
-                xj = data[j][0]
-                basis = basis * (x - xj) / (xi - xj)
-        total = total + basis
-    return total
+                denominator = denominator * scale * (xi - xj)
+        if not 1 / WEIGHT_RANGE <= abs(denominator) <= WEIGHT_RANGE:
+            return None
+        denominators.append(denominator)
+    return 1.0 / np.array(denominators)
 
 
-def newton_divided(data, x):
+def _barycentric_weights(x, scale):
+    if len(x) <= SMALL_FIT:
+        weights = _direct_weights(x.tolist(), scale)
+        if weights is not None:
+            return weights
+    logs = np.empty(len(x))
+    signs = np.empty(len(x))
+    with np.errstate(divide='ignore'):
+        for i, xi in enumerate(x):
+            d = scale * (xi - x)
+            d[i] = 1.0
+            logs[i] = np.log(np.abs(d)).sum()
+            signs[i] = -1.0 if np.count_nonzero(d < 0) % 2 else 1.0
+    if not np.all(np.isfinite(logs)):
+        raise ValueError("Узлы x не должны повторяться")
+    return signs * np.exp(logs.min() - logs) if len(x) else logs
+
+
+def _uniform_weights(count, step):
+    log_factorials = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, count)))])
+    logs = (count - 1) * math.log(abs(step)) + log_factorials + log_factorials[::-1]
+    signs = np.where((count - 1 - np.arange(count)) % 2, -1.0, 1.0)
+    return signs * np.exp(logs.min() - logs)
+
+
+class LagrangeInterpolant:
+    def __init__(self, x_vals, y_vals, weights, scale):
+        self.x_vals = x_vals
+        self.y_vals = y_vals
+        self.weights = weights
+        self.scale = scale
+
+    @classmethod
+    def fit(cls, data):
+        data = as_dataset(data)
+        x_vals = np.array(data.x, dtype=float)
+        span = float(x_vals.max() - x_vals.min()) if len(x_vals) else 0.0
+        scale = 4.0 / span if span > 0 else 1.0
+        if len(x_vals) > SMALL_FIT and data.is_uniform:
+            weights = _uniform_weights(len(x_vals), scale * data.step)
+        else:
+            weights = _barycentric_weights(x_vals, scale)
+        return cls(x_vals, np.array(data.y, dtype=float), weights, scale)
+
+    def add_node(self, x, y):
+        if np.any(self.x_vals == x):
+            raise ValueError(f"Узел x={x} уже есть")
+        diffs = self.scale * (self.x_vals - x)
+        k = int(np.argmax(np.abs(self.weights)))
+        spread = self.scale * (self.x_vals[k] - self.x_vals)
+        spread[k] = 1.0
+        exponent = math.log(abs(self.weights[k])) + np.log(np.abs(spread)).sum() - np.log(np.abs(diffs)).sum()
+        weights = self.weights / diffs
+        if exponent > 0:
+            weights *= math.exp(-exponent)
+            exponent = 0.0
+        sign = -1.0 if np.count_nonzero(diffs > 0) % 2 else 1.0
+        self.x_vals = np.append(self.x_vals, x)
+        self.y_vals = np.append(self.y_vals, y)
+        self.weights = np.append(weights, sign * math.exp(exponent))
+        self._rebalance()
+
+    def remove_node(self, x):
+        keep = self.x_vals != x
+        if keep.all():
+            raise ValueError(f"Узла x={x} нет")
+        self.x_vals = self.x_vals[keep]
+        self.y_vals = self.y_vals[keep]
+        self.weights = self.weights[keep] * (self.scale * (self.x_vals - x))
+        self._rebalance()
+
+    def _rebalance(self):
+        largest = float(np.max(np.abs(self.weights), initial=1.0))
+        if not 1 / WEIGHT_RANGE <= largest <= WEIGHT_RANGE:
+            self.weights = self.weights / largest
+
+    def evaluate(self, x):
+        xq = np.asarray(x, dtype=float)
+        flat = xq.reshape(-1)
+        result = np.empty(flat.shape)
+        columns = np.column_stack([self.y_vals, np.ones(len(self.y_vals))])
+        rows = max(1, LAGRANGE_BLOCK // len(self.x_vals))
+        for start in range(0, len(flat), rows):
+            result[start:start + rows] = self._evaluate(flat[start:start + rows], columns)
+        result = result.reshape(xq.shape)
+        return result if xq.ndim else result[()]
+
+    def _evaluate(self, xs, columns):
+        terms = np.subtract.outer(xs, self.x_vals)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(self.weights, terms, out=terms)
+            sums = terms @ columns
+            result = sums[:, 0] / sums[:, 1]
+        exact = np.flatnonzero(np.isnan(result))
+        if exact.size:
+            rows, cols = np.nonzero(xs[exact, None] == self.x_vals)
+            result[exact[rows]] = self.y_vals[cols]
+        return result
+
+
+def divided_diff_edges(data):
+    data = as_dataset(data)
     n = len(data)
-    x_vals = []
-    for i in range(n):
-        x_vals.append(data[i][0])
-    dd = build_divided_diff(data)
-    result = dd[0][0]
-    product = 1.0
-    for level in range(1, n):
-        product = product * (x - x_vals[level - 1])
-        term = dd[0][level]
-        result = result + term * product
-    return result
+    if n <= SMALL_FIT:
+        x = data.x.tolist()
+        column = data.y.tolist()
+        diagonal = column[-1:]
+        try:
+            for level in range(1, n):
+                for i in range(n - 1, level - 1, -1):
+                    column[i] = (column[i] - column[i - 1]) / (x[i] - x[i - level])
+                diagonal.append(column[-1])
+        except ZeroDivisionError:
+            raise ValueError("Узлы x не должны повторяться")
+        return np.array(column), np.array(diagonal[::-1])
 
+    return _divided_columns(data.x, data.y)
 
 
-def newton_finite(data, x):
-    pts = sorted(data, key=lambda pt: pt[0])
-    n = len(pts)
+def _divided_columns(x, y):
+    n = len(x)
+    if len(np.unique(x)) != n:
+        raise ValueError("Узлы x не должны повторяться")
+    column = np.array(y, dtype=float)
+    diagonal = np.empty_like(column)
+    diagonal[-1] = column[-1]
+    x = x.reshape((-1,) + (1,) * (column.ndim - 1))
+    with np.errstate(over='ignore', invalid='ignore'):
+        for level in range(1, n):
+            column[level:] = (column[level:] - column[level - 1:-1]) / (x[level:] - x[:n - level])
+            diagonal[n - 1 - level] = column[-1]
+    return column, diagonal
 
-    x_vals = []
-    for i in range(n):
-        x_vals.append(pts[i][0])
 
-    y_vals = []
-    for i in range(n):
-        y_vals.append(pts[i][1])
+class NewtonInterpolant:
+    def __init__(self, x_vals, coeffs, diagonal):
+        self.x_vals = x_vals
+        self.coeffs = coeffs
+        self.diagonal = diagonal
 
-    h = x_vals[1] - x_vals[0]
-    for i in range(1, n - 1):
-        if abs((x_vals[i + 1] - x_vals[i]) - h) > 1e-8:
-            raise ValueError("Узлы неравномерны: метод конечных разностей недоступен")
+    @classmethod
+    def fit(cls, data):
+        data = as_dataset(data)
+        coeffs, diagonal = divided_diff_edges(data)
+        return cls(data.x, coeffs, diagonal)
 
-    diff_table = build_diff_table(pts)
+    def add_node(self, x, y):
+        if np.any(self.x_vals == x):
+            raise ValueError(f"Узел x={x} уже есть")
+        diagonal = [y]
+        for xi, previous in zip(reversed(self.x_vals.tolist()), reversed(self.diagonal.tolist())):
+            diagonal.append((diagonal[-1] - previous) / (x - xi))
+        self.x_vals = np.append(self.x_vals, x)
+        self.coeffs = np.append(self.coeffs, diagonal[-1])
+        self.diagonal = np.array(diagonal[::-1])
 
-    if x <= x_vals[n // 2]:
-        t = (x - x_vals[0]) / h
-        result = y_vals[0]
-        factorial = 1.0
-        term_prod = 1.0
-        for k in range(1, n):
-            term_prod = term_prod * (t - (k - 1))
-            factorial = factorial * k
-            delta = diff_table[k][0]
-            result = result + term_prod * delta / factorial
+    def evaluate(self, x):
+        x = _as_query(x)
+        x_vals = self.x_vals.tolist()
+        coeffs = self.coeffs.tolist()
+        result = _filled(x, coeffs[-1])
+        for k in range(len(coeffs) - 2, -1, -1):
+            result = result * (x - x_vals[k]) + coeffs[k]
         return result
-    else:
-        t = (x - x_vals[n - 1]) / h
-        result = y_vals[n - 1]
+
+
+class NewtonFiniteInterpolant:
+    def __init__(self, x_vals, h, top, bottom):
+        self.x_vals = x_vals
+        self.h = h
+        self.top = top
+        self.bottom = bottom
+        self._coefficients()
+
+    @classmethod
+    def fit(cls, data):
+        data = as_dataset(data).sorted()
+        h = _uniform_step(data)
+        n = len(data)
+        entries = diff_entries(data, lambda k, size: (0, size - 1))
+        top = np.array([entries[k][0] for k in range(n)])
+        bottom = np.array([entries[k][n - 1 - k] for k in range(n)])
+        return cls(np.array(data.x, dtype=float), h, top, bottom)
+
+    def _coefficients(self):
+        forward = []
+        backward = []
         factorial = 1.0
-        term_prod = 1.0
-        for k in range(1, n):
-            term_prod = term_prod * (t + (k - 1))
-            factorial = factorial * k
-            delta = diff_table[k][n - k - 1]
-            result = result + term_prod * delta / factorial
+        for k, (top, bottom) in enumerate(zip(self.top.tolist(), self.bottom.tolist())):
+            if k > 0:
+                factorial = factorial * k
+            forward.append(top / factorial)
+            backward.append(bottom / factorial)
+        self.forward = np.array(forward)
+        self.backward = np.array(backward)
+
+    def add_node(self, x, y):
+        if abs((x - self.x_vals[-1]) - self.h) > 1e-8:
+            raise ValueError("Узлы неравномерны: метод конечных разностей недоступен")
+        bottom = [y]
+        for previous in self.bottom.tolist():
+            bottom.append(bottom[-1] - previous)
+        self.bottom = np.array(bottom)
+        self.top = np.append(self.top, bottom[-1])
+        self.x_vals = np.append(self.x_vals, x)
+        self._coefficients()
+
+    def evaluate(self, x):
+        x = _as_query(x)
+        mid = self.x_vals[len(self.x_vals) // 2]
+        if isinstance(x, np.ndarray):
+            result = np.empty_like(x)
+            forward = x <= mid
+            result[forward] = self._forward(x[forward])
+            result[~forward] = self._backward(x[~forward])
+            return result
+        if x <= mid:
+            return self._forward(x)
+        return self._backward(x)
+
+    def _forward(self, x):
+        t = (x - float(self.x_vals[0])) / self.h
+        forward = self.forward.tolist()
+        result = _filled(x, forward[-1])
+        for k in range(len(forward) - 2, -1, -1):
+            result = result * (t - k) + forward[k]
         return result
 
-def stirling_interpolation(data, x):
-    pts = sorted(data, key=lambda pt: pt[0])
-    n = len(pts) - 1
-    x_vals = []
-    y_vals = []
-    for pt in pts:
-        x_vals.append(pt[0])
-        y_vals.append(pt[1])
-
-    h = x_vals[1] - x_vals[0]
-    center = n // 2
-    t = (x - x_vals[center]) / h
+    def _backward(self, x):
+        t = (x - float(self.x_vals[-1])) / self.h
+        backward = self.backward.tolist()
+        result = _filled(x, backward[-1])
+        for k in range(len(backward) - 2, -1, -1):
+            result = result * (t + k) + backward[k]
+        return result
+
+
+StirlingPlan = namedtuple('StirlingPlan', ['center', 'shifts', 'mid', 'side', 'divisors'])
+BesselPlan = namedtuple('BesselPlan', ['m', 'picks', 'even', 'odd', 'even_divisors', 'odd_divisors'])
 
-    diff_table = build_diff_table(pts)
 
+@lru_cache(maxsize=None)
+def stirling_plan(count):
+    n = count - 1
+    center = n // 2
     shifts = [0]
     for i in range(1, n + 1):
         shifts.append(-i)
         shifts.append(i)
-    new_shifts = []
-    for i in range(0, n):
-        new_shifts.append(shifts[i])
-    shifts = new_shifts
 
-    s_forward = y_vals[center]
-    s_backward = y_vals[center]
+    mid = [center]
+    side = [center]
+    divisors = [1.0]
     factorial = 1.0
-    term_f = 1.0
-    term_b = 1.0
-
     for k in range(1, n + 1):
         factorial = factorial * k
-        shift_val = shifts[k - 1]
+        size = n + 1 - k
+        offset = 1 if size % 2 == 0 else 0
+        mid.append(size // 2)
+        side.append(size // 2 - offset)
+        divisors.append(factorial)
+    shifts = np.array(shifts[:n])
+    shifts.flags.writeable = False
+    return StirlingPlan(center, shifts, tuple(mid), tuple(side), tuple(divisors))
+
+
+@lru_cache(maxsize=None)
+def bessel_plan(count):
+    levels = count
+    m = count // 2 - 1
+    picks = [()] * levels
+    picks[0] = (m, m + 1)
+    picks[1] = (m,)
 
-        term_f = term_f * (t + shift_val)
-        term_b = term_b * (t - shift_val)
+    even = []
+    odd = []
+    even_divisors = []
+    odd_divisors = []
+    factorial = 2.0
+    r = 1
+    while True:
+        k_even = 2 * r
+        k_odd = k_even + 1
+        left = m - r
 
-        col = diff_table[k]
-        idx_mid = len(col) // 2
-        delta_mid = col[idx_mid]
+        if k_even < levels and 0 <= left and left + 1 < levels - k_even:
+            even.append(left)
+            picks[k_even] = (left, left + 1)
+        else:
+            even.append(None)
+        even_divisors.append(factorial)
 
-        if len(col) % 2 == 0:
-            offset = 1
+        factorial = factorial * k_odd
+        if k_odd < levels and 0 <= left < levels - k_odd:
+            odd.append(left)
+            picks[k_odd] = (left,)
         else:
-            offset = 0
-        delta_side = col[idx_mid - offset]
+            odd.append(None)
+        odd_divisors.append(factorial)
 
-        s_forward = s_forward + term_f * delta_mid / factorial
-        s_backward = s_backward + term_b * delta_side / factorial
+        if k_even >= levels and k_odd >= levels:
+            break
+        if m - r - 1 < 0:
+            break
+        factorial = factorial * (k_odd + 1)
+        r += 1
 
-    return 0.5 * (s_forward + s_backward)
+    return BesselPlan(m, tuple(picks), tuple(even), tuple(odd), tuple(even_divisors), tuple(odd_divisors))
 
 
+class StirlingInterpolant:
+    def __init__(self, x0, h, shifts, forward, backward):
+        self.x0 = x0
+        self.h = h
+        self.shifts = shifts
+        self.forward = forward
+        self.backward = backward
 
-def bessel_interpolation(data, x):
-    pts = sorted(data, key=lambda pt: pt[0])
-    n = len(pts)
-    x_vals = []
-    y_vals = []
-    for pt in pts:
-        x_vals.append(pt[0])
-        y_vals.append(pt[1])
+    @classmethod
+    def fit(cls, data):
+        data = as_dataset(data).sorted()
+        plan = stirling_plan(len(data))
+        h = float(data.x[1] - data.x[0])
+        entries = diff_entries(data, lambda k, size: (plan.mid[k], plan.side[k]))
 
-    h = x_vals[1] - x_vals[0]
-    diff_table = build_diff_table(pts)
+        forward = []
+        backward = []
+        for k, divisor in enumerate(plan.divisors):
+            forward.append(entries[k][plan.mid[k]] / divisor)
+            backward.append(entries[k][plan.side[k]] / divisor)
+        return cls(float(data.x[plan.center]), h, plan.shifts, np.array(forward), np.array(backward))
 
-    m = n // 2 - 1
-    t = (x - x_vals[m]) / h
+    def evaluate(self, x):
+        x = _as_query(x)
+        t = (x - self.x0) / self.h
+        shifts = self.shifts.tolist()
+        forward = self.forward.tolist()
+        backward = self.backward.tolist()
+        s_forward = _filled(x, forward[-1])
+        s_backward = _filled(x, backward[-1])
+        for k in range(len(shifts) - 1, -1, -1):
+            s_forward = s_forward * (t + shifts[k]) + forward[k]
+            s_backward = s_backward * (t - shifts[k]) + backward[k]
+        return 0.5 * (s_forward + s_backward)
 
-    result = 0.5 * (y_vals[m] + y_vals[m + 1])
-    result += (t - 0.5) * diff_table[1][m]
 
-    term_even = t * (t - 1) / 2
-    term_odd = (t - 0.5) * t * (t - 1) / 6
+class BesselInterpolant:
+    def __init__(self, x0, h, base, first, even, odd):
+        self.x0 = x0
+        self.h = h
+        self.base = base
+        self.first = first
+        self.even = even
+        self.odd = odd
 
-    r = 1
-    while True:
-        k_even = 2 * r
-        k_odd = k_even + 1
+    @classmethod
+    def fit(cls, data):
+        data = as_dataset(data).sorted()
+        plan = bessel_plan(len(data))
+        m = plan.m
+        h = float(data.x[1] - data.x[0])
+        entries = diff_entries(data, lambda k, size: plan.picks[k])
+
+        base = 0.5 * (entries[0][m] + entries[0][m + 1])
+        first = entries[1][m]
+        even = []
+        odd = []
+        for r in range(1, len(plan.even) + 1):
+            left = plan.even[r - 1]
+            avg_val = 0.0
+            if left is not None:
+                avg_val = 0.5 * (entries[2 * r][left] + entries[2 * r][left + 1])
+            even.append(avg_val / plan.even_divisors[r - 1])
+
+            idx = plan.odd[r - 1]
+            odd_val = 0.0 if idx is None else entries[2 * r + 1][idx]
+            odd.append(odd_val / plan.odd_divisors[r - 1])
+
+        return cls(float(data.x[m]), h, base, first, np.array(even), np.array(odd))
+
+    def evaluate(self, x):
+        x = _as_query(x)
+        t = (x - self.x0) / self.h
+        half = t - 0.5
+        even = self.even.tolist()
+        odd = self.odd.tolist()
+        series = even[-1] + half * odd[-1]
+        for r in range(len(even) - 1, 0, -1):
+            series = series * (t + r) * (t - r - 1) + even[r - 1] + half * odd[r - 1]
+        return self.base + half * self.first + t * (t - 1) * series
+
+
+INTERPOLANTS = {
+    'lagrange': LagrangeInterpolant,
+    'newton_divided': NewtonInterpolant,
+    'newton_finite': NewtonFiniteInterpolant,
+    'stirling': StirlingInterpolant,
+    'bessel': BesselInterpolant,
+}
+
+
+def nearest_window(x_vals, x, size):
+    n = len(x_vals)
+    pos = np.searchsorted(x_vals, x)
+    if size % 2 == 1:
+        left = np.clip(pos - 1, 0, n - 1)
+        right = np.clip(pos, 0, n - 1)
+        pos = np.where(x - x_vals[left] <= x_vals[right] - x, left, right)
+    return np.clip(pos - size // 2, 0, n - size)
+
+
+class LocalInterpolant:
+    def __init__(self, data, method, window, cache_size=4096):
+        self.data = as_dataset(data).sorted()
+        self.x_vals = self.data.x
+        if method == 'stirling' and window % 2 == 0:
+            window += 1
+        if method == 'bessel' and window % 2 == 1:
+            window += 1
+        if window < 2 or window > len(self.data):
+            raise ValueError(f"Размер окна должен быть от 2 до {len(self.data)}")
+        self.interpolant = INTERPOLANTS[method]
+        self.window = window
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state['_cache'], state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fitted(self, start):
+        with self._lock:
+            fitted = self._cache.get(start)
+            if fitted is not None:
+                self._cache.move_to_end(start)
+                return fitted
+        fitted = self.interpolant.fit(self.data[start:start + self.window])
+        with self._lock:
+            self._cache[start] = fitted
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return fitted
+
+    def evaluate(self, x):
+        xq = np.asarray(x, dtype=float)
+        starts = nearest_window(self.x_vals, xq, self.window)
+        if xq.ndim == 0:
+            return self.fitted(int(starts)).evaluate(float(xq))
+
+        flat_x = xq.ravel()
+        flat_starts = starts.ravel()
+        order = np.argsort(flat_starts, kind='stable')
+        groups, bounds = np.unique(flat_starts[order], return_index=True)
+        bounds = np.append(bounds, len(order))
+        result = np.empty(flat_x.shape)
+        for g, start in enumerate(groups):
+            idx = order[bounds[g]:bounds[g + 1]]
+            result[idx] = self.fitted(int(start)).evaluate(flat_x[idx])
+        return result.reshape(xq.shape)
+
+
+AUTO = 'auto'
+METHOD_LABELS = {
+    'lagrange': "Лагранж",
+    'newton_divided': "Ньютон (раздел.)",
+    'newton_finite': "Ньютон (конеч.)",
+    'stirling': "Стирлинг",
+    'bessel': "Бессель",
+    AUTO: "Авто",
+}
+AUTO_CENTRAL = 1.0
+
+
+class AutoInterpolant:
+    def __init__(self, data, window=None):
+        self.data = as_dataset(data).sorted()
+        self.window = window
+        self.size = min(window, len(self.data)) if window else len(self.data)
+        self.central = 'stirling' if self.size % 2 == 1 else 'bessel'
+        self.fits = {}
+
+    def fitted(self, method):
+        fitted = self.fits.get(method)
+        if fitted is None:
+            if self.window:
+                fitted = LocalInterpolant(self.data, method, self.window)
+            else:
+                fitted = INTERPOLANTS[method].fit(self.data)
+            self.fits[method] = fitted
+        return fitted
+
+    def prepare(self, x):
+        for method in self.plan(x):
+            self.fitted(method)
+
+    def plan(self, x):
+        flat = np.asarray(x, dtype=float).ravel()
+        h = self.data.step
+        if h is None:
+            return {'newton_divided': np.arange(flat.size)}
+        reach = ((self.size - 1) / 2 - AUTO_CENTRAL) * h
+        central = (flat >= self.data.x[0] + reach) & (flat <= self.data.x[-1] - reach)
+        plan = {self.central: np.flatnonzero(central), 'newton_finite': np.flatnonzero(~central)}
+        return {method: index for method, index in plan.items() if index.size}
+
+    def method_for(self, x):
+        return next(iter(self.plan(x)))
+
+    def evaluate(self, x):
+        xq = np.asarray(x, dtype=float)
+        flat = xq.ravel()
+        result = np.empty(flat.shape)
+        for method, index in self.plan(flat).items():
+            result[index] = self.fitted(method).evaluate(flat[index])
+        result = result.reshape(xq.shape)
+        return result if xq.ndim else result[()]
+
+
+SERIES_CHUNK = 16384
+SERIES_BUDGET = 32 * 2 ** 20
+
+
+def _horner(t, shifts, coeffs):
+    acc = np.tile(coeffs[-1], (len(t), 1))
+    for k in range(len(shifts) - 1, -1, -1):
+        acc *= (t + shifts[k])[:, None]
+        acc += coeffs[k]
+    return acc
+
+
+def _column_levels(Y):
+    level = Y
+    while len(level):
+        yield level
+        level = np.diff(level, axis=0)
+
+
+class SeriesInterpolant:
+    def __init__(self, method, columns):
+        self.method = method
+        self.columns = columns
+        self.template = None
+
+    @classmethod
+    def fit(cls, x, Y, method):
+        Y = np.asarray(Y, dtype=float)
+        if Y.ndim == 1:
+            Y = Y[:, None]
+        data = Dataset(x, Y[:, 0])
+        if method not in ('lagrange', 'newton_divided') and not data.is_sorted:
+            order = np.argsort(data.x, kind='stable')
+            Y = Y[order]
+            data = Dataset(data.x[order], Y[:, 0], True)
+        series = cls(method, Y.shape[1])
+        getattr(series, '_fit_' + method)(data, Y)
+        return series
+
+    def _fit_lagrange(self, data, Y):
+        self.template = LagrangeInterpolant.fit(data)
+        self.coeffs = Y
+
+    def _fit_newton_divided(self, data, Y):
+        self.coeffs, diagonal = _divided_columns(data.x, Y)
+        self.template = NewtonInterpolant(data.x, self.coeffs[:, 0], diagonal[:, 0])
+
+    def _fit_newton_finite(self, data, Y):
+        h = _uniform_step(data)
+        top = np.empty(Y.shape)
+        bottom = np.empty(Y.shape)
+        for k, level in enumerate(_column_levels(Y)):
+            top[k] = level[0]
+            bottom[k] = level[-1]
+        with np.errstate(over='ignore', invalid='ignore'):
+            factorials = np.cumprod(np.maximum(np.arange(len(Y)), 1), dtype=float)[:, None]
+            self.forward = top / factorials
+            self.backward = bottom / factorials
+        self.template = NewtonFiniteInterpolant(data.x, h, top[:, 0], bottom[:, 0])
 
-        if k_even < len(diff_table):
-            left = m - r
-            right = left + 1
-            if 0 <= left and right < len(diff_table[k_even]):
-                avg_val = 0.5 * (diff_table[k_even][left] + diff_table[k_even][right])
-                result += term_even * avg_val
+    def _fit_stirling(self, data, Y):
+        plan = stirling_plan(len(data))
+        self.forward = np.empty(Y.shape)
+        self.backward = np.empty(Y.shape)
+        for k, level in enumerate(_column_levels(Y)):
+            self.forward[k] = level[plan.mid[k]] / plan.divisors[k]
+            self.backward[k] = level[plan.side[k]] / plan.divisors[k]
+        h = float(data.x[1] - data.x[0])
+        self.template = StirlingInterpolant(
+            float(data.x[plan.center]), h, plan.shifts, self.forward[:, 0], self.backward[:, 0]
+        )
 
-        if k_odd < len(diff_table):
-            idx = m - r
-            if 0 <= idx < len(diff_table[k_odd]):
-                result += term_odd * diff_table[k_odd][idx]
+    def _fit_bessel(self, data, Y):
+        plan = bessel_plan(len(data))
+        m = plan.m
+        self.even = np.zeros((len(plan.even), Y.shape[1]))
+        self.odd = np.zeros((len(plan.odd), Y.shape[1]))
+        for k, level in enumerate(_column_levels(Y)):
+            if k == 0:
+                self.base = 0.5 * (level[m] + level[m + 1])
+            elif k == 1:
+                self.first = level[m]
+            elif k % 2 == 0:
+                left = plan.even[k // 2 - 1] if k // 2 <= len(plan.even) else None
+                if left is not None:
+                    self.even[k // 2 - 1] = 0.5 * (level[left] + level[left + 1]) / plan.even_divisors[k // 2 - 1]
+            else:
+                idx = plan.odd[k // 2 - 1] if k // 2 <= len(plan.odd) else None
+                if idx is not None:
+                    self.odd[k // 2 - 1] = level[idx] / plan.odd_divisors[k // 2 - 1]
+        h = float(data.x[1] - data.x[0])
+        self.template = BesselInterpolant(
+            float(data.x[m]), h, float(self.base[0]), float(self.first[0]),
+            self.even[:, 0], self.odd[:, 0],
+        )
 
-        if k_even >= len(diff_table) and k_odd >= len(diff_table):
+    def chunk_rows(self):
+        width = 4 * self.columns
+        if self.method == 'lagrange':
+            width += 5 * len(self.template.x_vals)
+        return max(1, SERIES_BUDGET // (8 * width))
+
+    def evaluate(self, xs):
+        xs = np.atleast_1d(np.asarray(xs, dtype=float))
+        out = np.empty((len(xs), self.columns))
+        rows = self.chunk_rows()
+        for start in range(0, len(xs), rows):
+            chunk = xs[start:start + rows]
+            out[start:start + len(chunk)] = getattr(self, '_' + self.method)(chunk)
+        return out
+
+    def _lagrange(self, xs):
+        nodes = self.template.x_vals
+        weights = self.template.weights
+        d = xs[:, None] - nodes
+        hit = d == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            basis = weights / d
+        rows = hit.any(axis=1)
+        basis[rows] = hit[rows]
+        basis[~rows] /= basis[~rows].sum(axis=1, keepdims=True)
+        return basis @ self.coeffs
+
+    def _newton_divided(self, xs):
+        nodes = self.template.x_vals
+        acc = np.tile(self.coeffs[-1], (len(xs), 1))
+        for k in range(len(nodes) - 2, -1, -1):
+            acc *= (xs - nodes[k])[:, None]
+            acc += self.coeffs[k]
+        return acc
+
+    def _newton_finite(self, xs):
+        f = self.template
+        n = len(f.x_vals)
+        out = np.empty((len(xs), self.columns))
+        forward = xs <= f.x_vals[n // 2]
+        out[forward] = _horner((xs[forward] - f.x_vals[0]) / f.h, [-k for k in range(n - 1)], self.forward)
+        out[~forward] = _horner((xs[~forward] - f.x_vals[-1]) / f.h, list(range(n - 1)), self.backward)
+        return out
+
+    def _stirling(self, xs):
+        f = self.template
+        t = (xs - f.x0) / f.h
+        forward = _horner(t, f.shifts, self.forward)
+        backward = _horner(t, -f.shifts, self.backward)
+        return 0.5 * (forward + backward)
+
+    def _bessel(self, xs):
+        t = (xs - self.template.x0) / self.template.h
+        half = (t - 0.5)[:, None]
+        series = self.even[-1] + half * self.odd[-1]
+        for r in range(len(self.even) - 1, 0, -1):
+            series *= ((t + r) * (t - r - 1))[:, None]
+            series += self.even[r - 1] + half * self.odd[r - 1]
+        return self.base + half * self.first + (t * (t - 1))[:, None] * series
+
+
+ITEM_BYTES = 32
+
+
+def _approx_size(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, (list, tuple)):
+        if obj and isinstance(obj[0], (list, tuple, np.ndarray, Dataset)):
+            return ITEM_BYTES * len(obj) + sum(_approx_size(item) for item in obj)
+        return ITEM_BYTES * len(obj)
+    if isinstance(obj, dict):
+        return ITEM_BYTES * len(obj) + sum(_approx_size(v) for v in obj.values())
+    if hasattr(obj, '__dict__'):
+        return _approx_size(vars(obj))
+    if hasattr(type(obj), '__slots__'):
+        return sum(_approx_size(getattr(obj, name, None)) for name in type(obj).__slots__)
+    return ITEM_BYTES
+
+
+class FitCache:
+    def __init__(self, max_bytes=64 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        return self._size
+
+    def peek(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+        return None if entry is None else entry[0]
+
+    def get(self, key, build):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        value = build()
+        size = _approx_size(value)
+        if size > self.max_bytes:
+            self.rejected += 1
+            warnings.warn(
+                f"Объект {size / 2 ** 20:.1f} МиБ больше бюджета кэша {self.max_bytes / 2 ** 20:.1f} МиБ "
+                f"и будет строиться заново при каждом вызове", RuntimeWarning, stacklevel=2,
+            )
+            return value
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, size)
+                self._size += size
+                self._evict()
+        return value
+
+    def resize(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _evict(self):
+        while self._size > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+
+
+FIT_CACHE = FitCache()
+GROWABLE = ('lagrange', 'newton_divided', 'newton_finite')
+GROWTH_STEPS = 8
+
+
+def cached_diff_table(data, cache=FIT_CACHE):
+    data = as_dataset(data)
+    return cache.get((data.fingerprint(), 'diff_table'), lambda: build_diff_table(data))
+
+
+def fitted_interpolant(data, method, window=None, cache=FIT_CACHE):
+    data = as_dataset(data)
+    if method == AUTO:
+        build = lambda: AutoInterpolant(data, window)
+    elif window:
+        build = lambda: LocalInterpolant(data, method, window)
+    elif method in GROWABLE:
+        build = lambda: _grown_fit(data, method, cache)
+    else:
+        build = lambda: INTERPOLANTS[method].fit(data)
+    return cache.get((data.fingerprint(), method, window), build)
+
+
+def _grown_fit(data, method, cache):
+    if method == 'newton_finite' and not data.is_sorted:
+        return INTERPOLANTS[method].fit(data)
+    for count in range(len(data) - 1, max(len(data) - GROWTH_STEPS, 1) - 1, -1):
+        previous = cache.peek((data[:count].fingerprint(), method, None))
+        if previous is None:
+            continue
+        fitted = copy.copy(previous)
+        try:
+            for x, y in data[count:]:
+                fitted.add_node(x, y)
+        except ValueError:
             break
-        if m - r - 1 < 0:
+        return fitted
+    return INTERPOLANTS[method].fit(data)
+
+
+def adaptive_samples(func, left, right, tolerance=1 / 600, initial=65, max_points=4097):
+    xs = np.linspace(left, right, initial)
+    ys = np.asarray(func(xs), dtype=float)
+    finite = ys[np.isfinite(ys)]
+    span = float(finite.max() - finite.min()) if len(finite) else 0.0
+    tol = tolerance * (span if span > 0 else 1.0)
+
+    active = np.ones(len(xs) - 1, dtype=bool)
+    while active.any() and len(xs) < max_points:
+        idx = np.flatnonzero(active)[:max_points - len(xs)]
+        mids = 0.5 * (xs[idx] + xs[idx + 1])
+        y_mid = np.asarray(func(mids), dtype=float)
+        with np.errstate(invalid='ignore'):
+            error = np.abs(y_mid - 0.5 * (ys[idx] + ys[idx + 1]))
+        refine = error > tol
+        if not refine.any():
             break
+        pos = idx[refine] + 1
+        xs = np.insert(xs, pos, mids[refine])
+        ys = np.insert(ys, pos, y_mid[refine])
+        inserted = np.zeros(len(xs), dtype=bool)
+        inserted[pos + np.arange(len(pos))] = True
+        active = inserted[:-1] | inserted[1:]
+    return xs, ys
 
-        term_even *= (t + r) * (t - r - 1) / ((2 * r + 2) * (2 * r + 1))
-        term_odd *= (t + r) * (t - r - 1) / ((2 * r + 3) * (2 * r + 2))
-        r += 1
 
-    return result
+def cached_curve(data, method, window=None, cache=FIT_CACHE):
+    data = as_dataset(data)
+    fitted = fitted_interpolant(data, method, window, cache)
+    build = lambda: adaptive_samples(fitted.evaluate, data.x[0], data.x[-1])
+    return cache.get((data.fingerprint(), 'curve', method, window), build)
 
 
-def execute_interpolation(source, source_data, methods, x_point, gui):
-    try:
-        if source == 'file':
-            pts = []
-            with open(source_data, newline='') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 2:
-                        pts.append((float(row[0]), float(row[1])))
-        elif source == 'func':
-            fname = source_data['name']
-            left = source_data['left']
-            right = source_data['right']
-            count = source_data['n']
-            step = (right - left) / (count - 1)
-            func = MATH_FUNCTIONS[fname]
-            pts = [(left + i * step, func(left + i * step)) for i in range(count)]
-        else:  
-            pts = list(source_data)
-
-        pts.sort(key=lambda p: p[0])
-    except Exception as e:
-        gui.show_error(f"Ошибка подготовки данных: {e}")
-        return
+class Profiler:
+    def __init__(self, enabled=False, memory=False):
+        self.enabled = False
+        self.memory = memory
+        self.stats = {}
+        self.generation = 0
+        self._frames = []
+        self._tracing = False
+        self._lock = threading.Lock()
+        if enabled:
+            self.enable()
 
-    gui.clear_diff_table()
-    gui.clear_results()
+    def enable(self, memory=None):
+        if memory is not None:
+            self.memory = memory
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        self.enabled = True
 
-    diffs = build_diff_table(pts)
-    gui.update_diff_table(diffs)
+    def disable(self):
+        self.enabled = False
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
 
-    if methods.get('lagrange'):
-        try:
-            y_val = lagrange_interpolation(pts, x_point)
-            gui.add_result('Лагранж', f"{y_val:.6f}")
-        except Exception as e:
-            gui.show_error(f"Лагранж: {e}")
+    def reset(self):
+        with self._lock:
+            self.stats.clear()
+            self._frames = []
+            self.generation += 1
+
+    def stage(self, name):
+        if not self.enabled:
+            return _NO_STAGE
+        return self._measure(name)
 
-    if methods.get('newton_divided'):
+    @contextlib.contextmanager
+    def _measure(self, name):
+        frame = None
+        if self.memory and tracemalloc.is_tracing():
+            with self._lock:
+                current, peak = tracemalloc.get_traced_memory()
+                if self._frames:
+                    self._frames[-1][1] = max(self._frames[-1][1], peak)
+                tracemalloc.reset_peak()
+                frame = [current, current]
+                self._frames.append(frame)
+        generation = self.generation
+        start = time.perf_counter()
         try:
-            y_val = newton_divided(pts, x_point)
-            gui.add_result('Ньютон (раздел.)', f"{y_val:.6f}")
-        except Exception as e:
-            gui.show_error(f"Ньютон (раздел.): {e}")
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = 0
+            if frame is not None:
+                with self._lock:
+                    frame[1] = max(frame[1], tracemalloc.get_traced_memory()[1])
+                    self._frames = [f for f in self._frames if f is not frame]
+                    if self._frames:
+                        self._frames[-1][1] = max(self._frames[-1][1], frame[1])
+                    tracemalloc.reset_peak()
+                peak = frame[1] - frame[0]
+            self._record(name, elapsed, peak, generation)
+
+    def _record(self, name, elapsed, peak, generation):
+        with self._lock:
+            if generation != self.generation:
+                return
+            entry = self.stats.get(name)
+            if entry is None:
+                entry = self.stats[name] = {'calls': 0, 'time': 0.0, 'last': 0.0, 'peak': 0}
+            entry['calls'] += 1
+            entry['time'] += elapsed
+            entry['last'] = elapsed
+            entry['peak'] = max(entry['peak'], peak)
+
+    def report(self):
+        with self._lock:
+            return {name: dict(entry) for name, entry in self.stats.items()}
+
+    def columns(self, name):
+        entry = self.stats.get(name) if self.enabled else None
+        if entry is None:
+            return ()
+        return f"{entry['last'] * 1000:.3f}", str(entry['calls']), f"{entry['peak'] / 1024:.1f}"
+
+    def export_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+
+_NO_STAGE = contextlib.nullcontext()
+PROFILER = Profiler()
+STAGE_LABELS = {
+    'load': "Загрузка",
+    'diff_table': "Таблица разностей",
+    'plot': "График",
+}
+
+
+def lagrange_interpolation(data, x):
+    return LagrangeInterpolant.fit(data).evaluate(x)
+
+
+def newton_divided(data, x):
+    return NewtonInterpolant.fit(data).evaluate(x)
+
+
+def newton_finite(data, x):
+    return NewtonFiniteInterpolant.fit(data).evaluate(x)
+
+
+def stirling_interpolation(data, x):
+    return StirlingInterpolant.fit(data).evaluate(x)
+
+
+def bessel_interpolation(data, x):
+    return BesselInterpolant.fit(data).evaluate(x)
 
-    if methods.get('newton_finite'):
+
+RAW_SUFFIXES = ('.f64', '.bin', '.raw')
+
+
+def _parse_csv_chunk(lines, usecols=(0, 1)):
+    try:
+        return np.loadtxt(lines, delimiter=',', usecols=usecols, ndmin=2)
+    except ValueError:
+        rows = [row for row in csv.reader(lines) if len(row) >= 2]
+        if not rows:
+            return np.empty((0, 2))
+        if usecols is not None:
+            rows = [[row[i] for i in usecols] for row in rows]
+        return np.array([[float(value) for value in row] for row in rows])
+
+
+def _read_csv_table(path, chunk_rows, usecols=(0, 1)):
+    chunks = []
+    with open(path, newline='') as f:
+        while True:
+            lines = list(itertools.islice(f, chunk_rows))
+            if not lines:
+                break
+            chunk = _parse_csv_chunk(lines, usecols)
+            if len(chunk):
+                chunks.append(chunk)
+    if not chunks:
+        return np.empty((0, 2))
+    return np.concatenate(chunks)
+
+
+def read_nodes(path, chunk_rows=65536):
+    suffix = Path(path).suffix.lower()
+    if suffix == '.npy':
+        arr = np.load(path, mmap_mode='r')
+        if arr.ndim != 2 or 2 not in arr.shape:
+            raise ValueError("Ожидается массив формы (n, 2) или (2, n)")
+        if arr.shape[0] == 2 and arr.shape[1] != 2:
+            return Dataset(arr[0], arr[1])
+        return Dataset(arr[:, 0], arr[:, 1])
+    if suffix in RAW_SUFFIXES:
+        arr = np.memmap(path, dtype='<f8', mode='r')
+        if len(arr) % 2:
+            raise ValueError("Нечётное число значений в двоичном файле")
+        return Dataset(arr[0::2], arr[1::2])
+
+    table = _read_csv_table(path, chunk_rows)
+    return Dataset(np.ascontiguousarray(table[:, 0]), np.ascontiguousarray(table[:, 1]))
+
+
+def read_series(path, chunk_rows=65536):
+    if Path(path).suffix.lower() == '.npy':
+        table = np.load(path, mmap_mode='r')
+        if table.ndim != 2 or table.shape[1] < 2:
+            raise ValueError("Ожидается массив формы (n, 1 + m)")
+    else:
+        table = _read_csv_table(path, chunk_rows, usecols=None)
+    x = np.asarray(table[:, 0], dtype=float)
+    if np.all(x[1:] >= x[:-1]):
+        return np.ascontiguousarray(x), np.asarray(table[:, 1:], dtype=float)
+    order = np.argsort(x, kind='stable')
+    return x[order], np.asarray(table[order, 1:], dtype=float)
+
+
+def sample_function(name, left, right, count, cache=FIT_CACHE):
+    func = MATH_FUNCTIONS.get(name)
+    if func is None:
+        raise ValueError(f"Неизвестная функция: {name}")
+
+    def build():
+        step = (right - left) / (count - 1)
+        xs = left + np.arange(count) * step
+        ys = np.array(np.broadcast_to(func(xs), xs.shape), dtype=float)
+        xs.flags.writeable = False
+        ys.flags.writeable = False
+        return Dataset(xs, ys, is_sorted=step >= 0)
+
+    return cache.get(('samples', func, left, right, count), build)
+
+
+NODE_KINDS = ('equispaced', 'chebyshev')
+UNIFORM_METHODS = ('newton_finite', 'stirling', 'bessel')
+NODE_LABELS = {'equispaced': "равномерные", 'chebyshev': "Чебышёва"}
+NodeSelection = namedtuple('NodeSelection', 'data kind n estimate evaluations')
+
+
+def node_grid(kind, left, right, count):
+    k = np.arange(count)
+    if kind == 'chebyshev':
+        return (left + right) / 2 - (right - left) / 2 * np.cos(np.pi * k / (count - 1))
+    return left + k * ((right - left) / (count - 1))
+
+
+def _refine_count(kind, left, right, reference, probe, upper, budget):
+    exact = reference.evaluate(probe)
+    for count in range(2, upper):
+        nodes = node_grid(kind, left, right, count)
+        approx = LagrangeInterpolant.fit(Dataset(nodes, reference.evaluate(nodes), True)).evaluate(probe)
+        deviation = float(np.max(np.abs(approx - exact)))
+        if deviation <= budget:
+            return count, deviation
+    return upper, 0.0
+
+
+def _select_kind(func, kind, left, right, tolerance, max_nodes, probe):
+    count = min(5, max_nodes)
+    xs = node_grid(kind, left, right, count)
+    ys = np.asarray(func(xs), dtype=float)
+    evaluations = count
+    reference = LagrangeInterpolant.fit(Dataset(xs, ys, True))
+    values = reference.evaluate(probe)
+    estimate = float('inf')
+    while estimate > tolerance and 2 * count - 1 <= max_nodes:
+        finer = 2 * count - 1
+        grid = node_grid(kind, left, right, finer)
+        merged = np.empty(finer)
+        merged[0::2] = ys
+        merged[1::2] = func(grid[1::2])
+        evaluations += finer // 2
         try:
-            y_val = newton_finite(pts, x_point)
-            gui.add_result('Ньютон (конеч.)', f"{y_val:.6f}")
-        except Exception as e:
-            gui.show_error(f"Ньютон (конеч.): {e}")
-
-    if methods.get('stirling'):
-        if len(pts) % 2 == 0:
-            gui.show_error("Для Стирлинга нужно нечётное число узлов")
-        else:
+            candidate = LagrangeInterpolant.fit(Dataset(grid, merged, True))
+            candidate_values = candidate.evaluate(probe)
+        except (ArithmeticError, ValueError):
+            break
+        change = float(np.max(np.abs(candidate_values - values)))
+        if not change < estimate:
+            break
+        count, xs, ys, reference, values, estimate = finer, grid, merged, candidate, candidate_values, change
+    if estimate > tolerance:
+        return NodeSelection(Dataset(xs, ys, True), kind, count, estimate, evaluations)
+    best, deviation = _refine_count(kind, left, right, reference, probe, count, tolerance - estimate)
+    if best < count:
+        xs = node_grid(kind, left, right, best)
+        ys = np.asarray(func(xs), dtype=float)
+        evaluations += best
+    return NodeSelection(Dataset(xs, ys, True), kind, best, estimate + deviation, evaluations)
+
+
+def select_nodes(name, left, right, tolerance, max_nodes=65, kinds=NODE_KINDS, probe=513, cache=FIT_CACHE):
+    func = MATH_FUNCTIONS.get(name)
+    if func is None:
+        raise ValueError(f"Неизвестная функция: {name}")
+    if tolerance <= 0:
+        raise ValueError("Точность должна быть положительной")
+    if max_nodes < 3:
+        raise ValueError("Для подбора узлов нужно N ≥ 3")
+
+    def build():
+        grid = np.linspace(left, right, probe)
+        choices = [_select_kind(func, kind, left, right, tolerance, max_nodes, grid) for kind in kinds]
+        return min(choices, key=lambda c: (c.estimate > tolerance, c.n if c.estimate <= tolerance else c.estimate))
+
+    return cache.get(('nodes', func, left, right, tolerance, max_nodes, tuple(kinds)), build)
+
+
+def select_function_nodes(source_data):
+    return select_nodes(
+        source_data['name'], source_data['left'], source_data['right'], source_data['tolerance'],
+        source_data['n'], source_data.get('kinds', NODE_KINDS),
+    )
+
+
+def load_dataset(source, source_data):
+    if source == 'file':
+        pts = read_nodes(source_data)
+    elif source == 'func' and source_data.get('tolerance') is not None:
+        pts = select_function_nodes(source_data).data
+    elif source == 'func':
+        pts = sample_function(source_data['name'], source_data['left'], source_data['right'], source_data['n'])
+    else:  
+        pts = as_dataset(source_data)
+    return pts.sorted()
+
+
+def check_method(method, data, window=None):
+    if window:
+        return
+    if method == 'stirling' and len(data) % 2 == 0:
+        raise ValueError("Для Стирлинга нужно нечётное число узлов")
+    if method == 'bessel' and len(data) % 2 == 1:
+        raise ValueError("Для Бесселя нужно чётное число узлов")
+
+
+Result = namedtuple('Result', 'method x value seconds error')
+RESULT_METHODS = tuple(INTERPOLANTS) + (AUTO,)
+
+
+def iter_results(data, methods, x, window=None, chunk=SERIES_CHUNK):
+    xs = np.asarray(x, dtype=float)
+    scalar = xs.ndim == 0
+    xs = xs.reshape(-1)
+    failed = set()
+    for start in range(0, len(xs), chunk):
+        part = float(xs[0]) if scalar else xs[start:start + chunk]
+        for method in methods:
+            if method in failed:
+                continue
+            began = time.perf_counter()
             try:
-                y_val = stirling_interpolation(pts, x_point)
-                gui.add_result('Стирлинг', f"{y_val:.6f}")
+                check_method(method, data, window)
+                with PROFILER.stage(method):
+                    value = fitted_interpolant(data, method, window).evaluate(part)
             except Exception as e:
-                gui.show_error(f"Стирлинг: {e}")
+                failed.add(method)
+                yield Result(method, part, None, time.perf_counter() - began, str(e))
+                continue
+            yield Result(method, part, float(value) if scalar else value, time.perf_counter() - began, None)
+
+
+SweepRow = namedtuple('SweepRow', 'left right n method x value exact error')
 
-    if methods.get('bessel'):
-        if len(pts) % 2 == 1:
-            gui.show_error("Для Бесселя нужно чётное число узлов")
+
+def _nested_samples(func, left, right, count, counts, cache=FIT_CACHE):
+    def build():
+        step = (right - left) / (count - 1)
+        xs = left + np.arange(count) * step
+        coarse = None
+        for m in sorted(counts, reverse=True):
+            if m < count and (count - 1) % (m - 1) == 0:
+                coarse = cache.peek(('samples', func, left, right, m))
+                if coarse is not None:
+                    break
+        if coarse is None:
+            ys = np.array(np.broadcast_to(func(xs), xs.shape), dtype=float)
         else:
-            try:
-                y_val = bessel_interpolation(pts, x_point)
-                gui.add_result('Бессель', f"{y_val:.6f}")
-            except Exception as e:
-                gui.show_error(f"Бессель: {e}")
+            stride = (count - 1) // (len(coarse) - 1)
+            fresh = np.arange(count) % stride != 0
+            ys = np.empty(count)
+            ys[::stride] = coarse.y
+            ys[fresh] = func(xs[fresh])
+        xs.flags.writeable = False
+        ys.flags.writeable = False
+        return Dataset(xs, ys, is_sorted=step >= 0)
+
+    return cache.get(('samples', func, left, right, count), build)
 
+
+def convergence_sweep(name, counts, x, methods, intervals=((-3.14, 3.14),)):
+    func = MATH_FUNCTIONS.get(name)
+    if func is None:
+        raise ValueError(f"Неизвестная функция: {name}")
+    xs = np.atleast_1d(np.asarray(x, dtype=float)).ravel()
+    exact = np.array(np.broadcast_to(func(xs), xs.shape), dtype=float)
+    counts = sorted({int(n) for n in counts if n >= 2})
+    rows = []
+    for left, right in intervals:
+        for n in counts:
+            data = _nested_samples(func, left, right, n, counts)
+            for method in methods:
+                try:
+                    check_method(method, data)
+                except ValueError:
+                    continue
+                if method == AUTO:
+                    fitted = AutoInterpolant(data)
+                else:
+                    fitted = INTERPOLANTS[method].fit(data)
+                values = np.asarray(fitted.evaluate(xs), dtype=float)
+                for xq, value, true in zip(xs.tolist(), values.tolist(), exact.tolist()):
+                    rows.append(SweepRow(left, right, n, method, xq, value, true, value - true))
+    return rows
+
+
+def execute_interpolation(source, source_data, methods, x_point, gui, window=None):
     try:
-        gui.plot(pts, x_point)
+        with PROFILER.stage('load'):
+            pts = load_dataset(source, source_data)
+    except Exception as e:
+        gui.show_error(f"Ошибка подготовки данных: {e}")
+        return
+
+    gui.clear_diff_table()
+    gui.clear_results()
+    if source == 'func' and source_data.get('tolerance') is not None:
+        selection = select_function_nodes(source_data)
+        gui.add_result("Узлы", f"{NODE_LABELS[selection.kind]}, N={selection.n}")
+        gui.add_result("Оценка погрешности", f"{selection.estimate:.2e}")
+        if selection.estimate > source_data['tolerance']:
+            gui.show_error(f"Точность {source_data['tolerance']:g} не достигнута при N ≤ {source_data['n']}")
+
+    with PROFILER.stage('diff_table'):
+        if window:
+            start = int(nearest_window(pts.x, x_point, min(window, len(pts))))
+            table = DiffTable(pts[start:start + window])
+        else:
+            table = DiffTable(pts)
+    gui.update_diff_table(table)
+
+    selected = [method for method in RESULT_METHODS if methods.get(method)]
+    for result in iter_results(pts, selected, x_point, window):
+        label = METHOD_LABELS[result.method]
+        if result.error is not None:
+            gui.show_error(f"{label}: {result.error}")
+            continue
+        if result.method == AUTO:
+            label = f"{label} ({METHOD_LABELS[fitted_interpolant(pts, AUTO, window).method_for(x_point)]})"
+        gui.add_result(label, f"{result.value:.6f}", *PROFILER.columns(result.method))
+
+    try:
+        with PROFILER.stage('plot'):
+            gui.plot(pts, x_point)
     except AttributeError:
         pass
 
+    if PROFILER.enabled:
+        for stage, label in STAGE_LABELS.items():
+            if stage in PROFILER.stats:
+                gui.add_result(label, "", *PROFILER.columns(stage))
+
     gui.show_ok("Вычислено успешно")
@@ -0,0 +1,262 @@
+import math
+
+import numpy as np
+import pytest
+
+import reference
+from solver import (
+    AUTO, INTERPOLANTS, AutoInterpolant, Dataset, FitCache, LocalInterpolant, SeriesInterpolant,
+    bessel_interpolation, check_method, convergence_sweep, fitted_interpolant, iter_results, lagrange_interpolation,
+    newton_divided, newton_finite, register_function, stirling_interpolation,
+)
+
+FUNCTIONS = {
+    'lagrange': (lagrange_interpolation, reference.lagrange_interpolation),
+    'newton_divided': (newton_divided, reference.newton_divided),
+    'newton_finite': (newton_finite, reference.newton_finite),
+    'stirling': (stirling_interpolation, reference.stirling_interpolation),
+    'bessel': (bessel_interpolation, reference.bessel_interpolation),
+}
+ANY_GRID = ('lagrange', 'newton_divided')
+
+
+def uniform_points(n, left=-1.0, right=1.0, func=math.sin):
+    step = (right - left) / (n - 1)
+    return [(left + i * step, func(left + i * step)) for i in range(n)]
+
+
+def scattered_points(n, seed=0):
+    xs = sorted(np.random.default_rng(seed).uniform(-1.0, 1.0, n).tolist())
+    return [(x, math.exp(x) * math.cos(3 * x)) for x in xs]
+
+
+def node_count(method, n):
+    if method == 'stirling':
+        return n | 1
+    if method == 'bessel':
+        return n + n % 2
+    return n
+
+
+QUERIES = [-1.0, -0.73, -0.2, 0.0, 0.05, 0.41, 0.9, 1.0]
+
+
+@pytest.mark.parametrize('method', list(FUNCTIONS))
+@pytest.mark.parametrize('n', [4, 5, 9, 12])
+def test_scalar_matches_reference(method, n):
+    pts = uniform_points(node_count(method, n))
+    func, ref = FUNCTIONS[method]
+    for x in QUERIES:
+        assert func(Dataset.from_points(pts), x) == pytest.approx(ref(pts, x), rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize('method', list(FUNCTIONS))
+def test_array_matches_scalar(method):
+    pts = uniform_points(node_count(method, 9))
+    func, ref = FUNCTIONS[method]
+    xs = np.array(QUERIES)
+    values = func(Dataset.from_points(pts), xs)
+    assert values.shape == xs.shape
+    np.testing.assert_allclose(values, [ref(pts, x) for x in QUERIES], rtol=1e-12, atol=1e-12)
+    grid = xs.reshape(2, 4)
+    assert func(Dataset.from_points(pts), grid).shape == (2, 4)
+
+
+@pytest.mark.parametrize('method', ANY_GRID)
+def test_non_uniform_matches_reference(method):
+    pts = scattered_points(10)
+    func, ref = FUNCTIONS[method]
+    for x in QUERIES:
+        assert func(Dataset.from_points(pts), x) == pytest.approx(ref(pts, x), rel=1e-10, abs=1e-10)
+
+
+@pytest.mark.parametrize('method', list(INTERPOLANTS))
+def test_fit_reproduces_nodes(method):
+    data = Dataset.from_points(uniform_points(node_count(method, 11)))
+    np.testing.assert_allclose(INTERPOLANTS[method].fit(data).evaluate(data.x), data.y, rtol=0, atol=1e-12)
+
+
+def test_unsorted_input_matches_sorted():
+    pts = uniform_points(7)
+    shuffled = [pts[i] for i in (3, 0, 6, 1, 5, 2, 4)]
+    for method in FUNCTIONS:
+        if method == 'bessel':
+            continue
+        func, _ = FUNCTIONS[method]
+        assert func(Dataset.from_points(shuffled), 0.3) == pytest.approx(func(Dataset.from_points(pts), 0.3))
+
+
+def test_finite_differences_reject_non_uniform_nodes():
+    data = Dataset.from_points(scattered_points(6))
+    with pytest.raises(ValueError, match="неравномерны"):
+        INTERPOLANTS['newton_finite'].fit(data)
+
+
+def test_parity_checks():
+    with pytest.raises(ValueError, match="нечётное"):
+        check_method('stirling', range(6))
+    with pytest.raises(ValueError, match="чётное"):
+        check_method('bessel', range(7))
+    check_method('stirling', range(6), window=4)
+    check_method('bessel', range(7), window=4)
+
+
+@pytest.mark.parametrize('method', ANY_GRID)
+def test_duplicate_nodes_are_rejected(method):
+    with pytest.raises(ValueError):
+        INTERPOLANTS[method].fit(Dataset([0.0, 1.0, 1.0], [1.0, 2.0, 3.0]))
+
+
+@pytest.mark.parametrize('method', ANY_GRID)
+def test_add_node_matches_fresh_fit(method):
+    pts = scattered_points(12, seed=3)
+    fitted = INTERPOLANTS[method].fit(Dataset.from_points(pts[:7]))
+    for x, y in pts[7:]:
+        fitted.add_node(x, y)
+    fresh = INTERPOLANTS[method].fit(Dataset.from_points(pts))
+    xs = np.linspace(pts[0][0], pts[-1][0], 41)
+    np.testing.assert_allclose(fitted.evaluate(xs), fresh.evaluate(xs), rtol=1e-10, atol=1e-10)
+
+
+def test_newton_finite_add_node_matches_fresh_fit():
+    pts = uniform_points(10)
+    fitted = INTERPOLANTS['newton_finite'].fit(Dataset.from_points(pts[:6]))
+    for x, y in pts[6:]:
+        fitted.add_node(x, y)
+    fresh = INTERPOLANTS['newton_finite'].fit(Dataset.from_points(pts))
+    xs = np.linspace(-1.0, 1.0, 41)
+    np.testing.assert_allclose(fitted.evaluate(xs), fresh.evaluate(xs), rtol=1e-12, atol=1e-12)
+    with pytest.raises(ValueError):
+        fitted.add_node(5.0, 0.0)
+
+
+def test_add_node_rejects_existing_node():
+    pts = uniform_points(5)
+    for method in ANY_GRID:
+        fitted = INTERPOLANTS[method].fit(Dataset.from_points(pts))
+        with pytest.raises(ValueError):
+            fitted.add_node(pts[2][0], 0.0)
+
+
+def test_lagrange_remove_node_matches_fresh_fit():
+    pts = scattered_points(10, seed=5)
+    fitted = INTERPOLANTS['lagrange'].fit(Dataset.from_points(pts))
+    fitted.remove_node(pts[4][0])
+    fitted.remove_node(pts[0][0])
+    rest = [pt for i, pt in enumerate(pts) if i not in (0, 4)]
+    fresh = INTERPOLANTS['lagrange'].fit(Dataset.from_points(rest))
+    xs = np.linspace(rest[0][0], rest[-1][0], 41)
+    np.testing.assert_allclose(fitted.evaluate(xs), fresh.evaluate(xs), rtol=1e-10, atol=1e-10)
+
+
+@pytest.mark.parametrize('n', [1500, 3000])
+def test_lagrange_handles_many_chebyshev_nodes(n):
+    x = np.sort(np.cos(np.pi * (2 * np.arange(n) + 1) / (2 * n)))
+    fitted = INTERPOLANTS['lagrange'].fit(Dataset(x, np.sin(3 * x)))
+    xs = np.linspace(-0.99, 0.99, 101)
+    np.testing.assert_allclose(fitted.evaluate(xs), np.sin(3 * xs), atol=1e-12)
+
+
+@pytest.mark.parametrize('method', list(INTERPOLANTS))
+def test_series_matches_columns(method):
+    n = node_count(method, 11)
+    x = np.linspace(-1.0, 1.0, n)
+    Y = np.sin(np.outer(x, [1.0, 2.0, 3.0]))
+    xs = np.linspace(-1.0, 1.0, 57)
+    values = SeriesInterpolant.fit(x, Y, method).evaluate(xs)
+    for j in range(Y.shape[1]):
+        column = INTERPOLANTS[method].fit(Dataset(x, Y[:, j])).evaluate(xs)
+        np.testing.assert_allclose(values[:, j], column, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('method', list(INTERPOLANTS))
+def test_local_window_matches_window_fit(method):
+    data = Dataset.from_points(uniform_points(40, -2.0, 2.0))
+    local = LocalInterpolant(data, method, 6)
+    for x in (-1.93, -0.4, 0.0, 1.27, 2.0):
+        nearest = local.evaluate(x)
+        assert np.isfinite(nearest)
+        assert abs(nearest - math.sin(x)) < 1e-3
+    assert local.evaluate(np.array([-1.0, 0.5])).shape == (2,)
+
+
+def test_auto_uses_central_methods_inside_the_table():
+    data = Dataset.from_points(uniform_points(11))
+    auto = AutoInterpolant(data)
+    assert auto.method_for(0.05) == 'stirling'
+    assert auto.method_for(-0.98) == 'newton_finite'
+    assert AutoInterpolant(Dataset.from_points(scattered_points(8))).method_for(0.1) == 'newton_divided'
+    xs = np.linspace(-1.0, 1.0, 31)
+    np.testing.assert_allclose(auto.evaluate(xs), np.sin(xs), atol=1e-7)
+
+
+def test_iter_results_reports_errors_once():
+    data = Dataset.from_points(uniform_points(6))
+    rows = list(iter_results(data, ['lagrange', 'stirling', AUTO], np.linspace(-1, 1, 10), chunk=4))
+    errors = [row for row in rows if row.error is not None]
+    assert [row.method for row in errors] == ['stirling']
+    assert sum(len(row.x) for row in rows if row.method == 'lagrange') == 10
+    scalar = list(iter_results(data, ['lagrange'], 0.3))
+    assert scalar[0].value == pytest.approx(reference.lagrange_interpolation(uniform_points(6), 0.3))
+
+
+@pytest.mark.parametrize('method', list(INTERPOLANTS))
+def test_series_accepts_unsorted_nodes(method):
+    n = node_count(method, 9)
+    x = np.linspace(-1.0, 1.0, n)
+    order = np.random.default_rng(n).permutation(n)
+    Y = np.cos(np.outer(x, [1.0, 2.5]))
+    xs = np.linspace(-1.0, 1.0, 23)
+    np.testing.assert_allclose(
+        SeriesInterpolant.fit(x[order], Y[order], method).evaluate(xs),
+        SeriesInterpolant.fit(x, Y, method).evaluate(xs), rtol=1e-12, atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize('method', ['lagrange', 'newton_divided', 'newton_finite'])
+def test_growing_data_extends_cached_fit(method, monkeypatch):
+    cls = INTERPOLANTS[method]
+    fits = []
+    original = cls.fit.__func__
+    monkeypatch.setattr(cls, 'fit', classmethod(lambda c, data: fits.append(len(data)) or original(c, data)))
+    pts = uniform_points(16)
+    cache = FitCache()
+    previous = fitted_interpolant(Dataset.from_points(pts[:6]), method, cache=cache)
+    before = previous.evaluate(0.3)
+    for count in (7, 8, 11, 12, 16):
+        fitted = fitted_interpolant(Dataset.from_points(pts[:count]), method, cache=cache)
+    assert fits == [6]
+    assert previous.evaluate(0.3) == before
+    monkeypatch.undo()
+    fresh = cls.fit(Dataset.from_points(pts))
+    xs = np.linspace(-1.0, 1.0, 41)
+    np.testing.assert_allclose(fitted.evaluate(xs), fresh.evaluate(xs), rtol=1e-12, atol=1e-12)
+
+
+def test_growing_data_falls_back_to_a_full_fit():
+    cache = FitCache()
+    fitted_interpolant(Dataset.from_points(uniform_points(6)), 'newton_finite', cache=cache)
+    grown = Dataset.from_points(uniform_points(6) + [(1.7, 0.0)])
+    with pytest.raises(ValueError, match="неравномерны"):
+        fitted_interpolant(grown, 'newton_finite', cache=cache)
+    assert len(fitted_interpolant(grown, 'newton_divided', cache=cache).x_vals) == 7
+
+
+def test_convergence_sweep_reuses_nested_samples():
+    evaluated = []
+
+    def counted(x):
+        evaluated.append(np.size(x))
+        return np.sin(x)
+
+    register_function('counted_sin', counted)
+    xs = np.array([0.1, 0.7])
+    counts = [5, 9, 17, 6]
+    rows = convergence_sweep('counted_sin', counts, xs, ['newton_divided'], intervals=((-1.0, 1.0),))
+    assert sum(evaluated) == len(xs) + 5 + 4 + 8 + 6
+    assert [row.n for row in rows] == [5, 5, 6, 6, 9, 9, 17, 17]
+    assert all(abs(row.error) < 1e-2 for row in rows)
+    evaluated.clear()
+    again = convergence_sweep('counted_sin', counts, xs, ['newton_divided'], intervals=((-1.0, 1.0),))
+    assert evaluated == [len(xs)]
+    assert again == rows
@@ -0,0 +1,30 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from parallel import evaluate_parallel
+from solver import INTERPOLANTS, AutoInterpolant, Dataset
+
+
+def test_shared_pool_serves_successive_batches():
+    x = np.linspace(-1.0, 1.0, 9)
+    fits = [
+        INTERPOLANTS['newton_divided'].fit(Dataset(x, np.sin(x))),
+        INTERPOLANTS['lagrange'].fit(Dataset(x, np.cos(x))),
+        AutoInterpolant(Dataset(x, np.exp(x))),
+    ]
+    xs = np.linspace(-1.0, 1.0, 5000)
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context('spawn')) as pool:
+        for fitted in fits + fits[:1]:
+            values = evaluate_parallel(fitted, xs, workers=2, min_size=1000, pool=pool)
+            np.testing.assert_allclose(values, fitted.evaluate(xs), rtol=1e-14, atol=1e-15)
+
+
+def test_without_pool_evaluates_on_a_private_pool():
+    x = np.linspace(-1.0, 1.0, 7)
+    fitted = INTERPOLANTS['stirling'].fit(Dataset(x, np.sin(x)))
+    xs = np.linspace(-1.0, 1.0, 3000).reshape(100, 30)
+    values = evaluate_parallel(fitted, xs, workers=2, min_size=1000)
+    assert values.shape == xs.shape
+    np.testing.assert_array_equal(values, fitted.evaluate(xs))
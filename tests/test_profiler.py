@@ -0,0 +1,24 @@
+from solver import Profiler
+
+
+def test_reset_clears_stats_and_drops_stages_from_before():
+    profiler = Profiler(enabled=True)
+    with profiler.stage('load'):
+        pass
+    assert profiler.report()['load']['calls'] == 1
+    stale = profiler.stage('lagrange')
+    stale.__enter__()
+    profiler.reset()
+    stale.__exit__(None, None, None)
+    assert profiler.report() == {}
+    with profiler.stage('lagrange'):
+        pass
+    assert profiler.report()['lagrange']['calls'] == 1
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+    with profiler.stage('load'):
+        pass
+    assert profiler.report() == {}
+    assert profiler.columns('load') == ()
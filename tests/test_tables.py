@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+import reference
+from solver import (
+    Dataset, DiffTable, build_diff_table, build_divided_diff, export_diff_table, iter_diff_levels, read_nodes,
+)
+
+
+def sample(n):
+    x = np.linspace(0.0, 1.0, n)
+    return Dataset(x, np.random.default_rng(n).normal(size=n))
+
+
+@pytest.mark.parametrize('n', [1, 2, 7])
+def test_tables_match_reference(n):
+    data = sample(n)
+    pts = list(data)
+    assert build_diff_table(data) == reference.build_diff_table(pts)
+    assert build_divided_diff(data) == reference.build_divided_diff(pts)
+    levels = [level.tolist() for level in iter_diff_levels(data)]
+    assert levels == reference.build_diff_table(pts)
+
+
+def expected_block(full, row, row_stop, col, col_stop):
+    n = len(full)
+    rows = []
+    for r in range(row, min(row_stop, n)):
+        rows.append([full[c][r] if r < len(full[c]) else None for c in range(col, min(col_stop, n))])
+    return rows if col < min(col_stop, n) else []
+
+
+@pytest.mark.parametrize('n', [1, 2, 5, 12])
+def test_diff_table_block_matches_full_table(n):
+    data = sample(n)
+    full = build_diff_table(data)
+    table = DiffTable(data)
+    for row in range(n + 1):
+        for col in range(n + 1):
+            for rows, cols in ((1, 1), (3, 2), (n + 3, n + 3)):
+                assert table.block(row, row + rows, col, col + cols) == expected_block(
+                    full, row, row + rows, col, col + cols
+                )
+
+
+def test_diff_table_edges():
+    empty = DiffTable(Dataset([], []))
+    assert (empty.rows, empty.cols, len(empty)) == (0, 0, 0)
+    assert empty.block(0, 10, 0, 10) == []
+    table = DiffTable(sample(4))
+    assert table.block(2, 2, 0, 4) == []
+    assert table.block(0, 4, 3, 3) == []
+    assert table.block(3, 10, 1, 10) == [[None, None, None]]
+
+
+def test_export_diff_table(tmp_path):
+    path = tmp_path / "diffs.csv"
+    export_diff_table(DiffTable(Dataset([0.0, 1.0, 2.0], [1.0, 4.0, 9.0])), path)
+    assert path.read_text().splitlines() == ["y,d1,d2", "1.0,3.0,2.0", "4.0,5.0,", "9.0,,"]
+
+
+def test_read_csv_skips_short_rows(tmp_path):
+    path = tmp_path / "nodes.csv"
+    path.write_text("0,1\n\n1,2\nbad\n2,4,extra\n")
+    data = read_nodes(path)
+    assert data.x.tolist() == [0.0, 1.0, 2.0]
+    assert data.y.tolist() == [1.0, 2.0, 4.0]
+
+
+def test_read_csv_in_small_chunks(tmp_path):
+    path = tmp_path / "nodes.csv"
+    path.write_text("".join(f"{i},{i * i}\n" for i in range(10)))
+    data = read_nodes(path, chunk_rows=3)
+    assert data.x.tolist() == list(range(10))
+    assert data.y.tolist() == [i * i for i in range(10)]
+
+
+def test_read_empty_csv(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("")
+    assert len(read_nodes(path)) == 0
+
+
+def test_read_npy_in_both_orientations(tmp_path):
+    pairs = np.array([[0.0, 1.0], [1.0, 3.0], [2.0, 5.0]])
+    np.save(tmp_path / "rows.npy", pairs)
+    np.save(tmp_path / "cols.npy", pairs.T)
+    for name in ("rows.npy", "cols.npy"):
+        data = read_nodes(tmp_path / name)
+        assert data.x.tolist() == [0.0, 1.0, 2.0]
+        assert data.y.tolist() == [1.0, 3.0, 5.0]
+    np.save(tmp_path / "bad.npy", np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        read_nodes(tmp_path / "bad.npy")
+
+
+def test_read_raw_binary(tmp_path):
+    path = tmp_path / "nodes.f64"
+    np.array([0.0, 1.0, 1.0, 2.0], dtype='<f8').tofile(path)
+    data = read_nodes(path)
+    assert data.x.tolist() == [0.0, 1.0]
+    assert data.y.tolist() == [1.0, 2.0]
+    odd = tmp_path / "odd.bin"
+    np.array([0.0, 1.0, 2.0], dtype='<f8').tofile(odd)
+    with pytest.raises(ValueError):
+        read_nodes(odd)
+
+
+def test_read_quoted_csv(tmp_path):
+    path = tmp_path / "quoted.csv"
+    path.write_text('"0","1"\n"1","2.5"\n2,"4"\n')
+    data = read_nodes(path)
+    assert data.x.tolist() == [0.0, 1.0, 2.0]
+    assert data.y.tolist() == [1.0, 2.5, 4.0]